@@ -1,13 +1,39 @@
 from __future__ import annotations
 
-import json
-import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 # Allow a small set of safe fixture ids. Keep it strict to avoid path traversal.
 # Examples: `case_000042`, `case_redflag_000101`, `case_lowinfo_000102`.
-_CASE_REF_RE = re.compile(r"^case_[a-z0-9_]{6,32}$")
+# Equivalent to `^case_[a-z0-9_]{6,32}$`, checked without the regex engine.
+_CASE_REF_PREFIX = "case_"
+_CASE_REF_DROP_ALLOWED = str.maketrans("", "", string.ascii_lowercase + string.digits + "_")
+
+_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@lru_cache(maxsize=256)
+def _read_case_fixture(case_ref: str) -> bytes | None:
+    # Fixtures are static committed files: cache the raw bytes so repeated runs skip
+    # the filesystem. Parsing stays per call so every caller gets its own dict
+    # (orjson.loads is cheaper than deep-copying a shared parsed bundle).
+    path = _FIXTURES_DIR / f"{case_ref}.json"
+    if not path.exists():
+        return None
+    return path.read_bytes()
+
+
+def _is_valid_case_ref(case_ref: str) -> bool:
+    rest = case_ref[len(_CASE_REF_PREFIX) :]
+    return (
+        case_ref.startswith(_CASE_REF_PREFIX)
+        and 6 <= len(rest) <= 32
+        and not rest.translate(_CASE_REF_DROP_ALLOWED)
+    )
 
 
 def load_case_bundle(case_ref: str) -> dict[str, Any]:
@@ -15,15 +41,14 @@ def load_case_bundle(case_ref: str) -> dict[str, Any]:
 
     Kaggle demo only: fixtures are committed to the public repo and contain no PHI.
     """
-    if not _CASE_REF_RE.match(case_ref):
+    if not _is_valid_case_ref(case_ref):
         raise ValueError("unknown case_ref")
 
-    fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-    path = fixtures_dir / f"{case_ref}.json"
-    if not path.exists():
+    raw = _read_case_fixture(case_ref)
+    if raw is None:
         raise ValueError("unknown case_ref")
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = orjson.loads(raw)
     if not isinstance(payload, dict):
         raise ValueError("invalid case fixture")
 
@@ -1,29 +1,33 @@
 from __future__ import annotations
 
-import json
-from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Any
 
+import orjson
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
 
+# apps/api/src/pharmassist_api/contracts/load_schema.py -> repo root (resolved once).
+_REPO_ROOT = Path(__file__).resolve().parents[5]
+_SCHEMAS_DIR = _REPO_ROOT / "packages" / "contracts" / "schemas"
+_EXAMPLES_DIR = _REPO_ROOT / "packages" / "contracts" / "examples"
+
 
 def repo_root() -> Path:
-    # apps/api/src/pharmassist_api/contracts/load_schema.py -> repo root
-    return Path(__file__).resolve().parents[5]
+    return _REPO_ROOT
 
 
 def schemas_dir() -> Path:
-    return repo_root() / "packages" / "contracts" / "schemas"
+    return _SCHEMAS_DIR
 
 
 def examples_dir() -> Path:
-    return repo_root() / "packages" / "contracts" / "examples"
+    return _EXAMPLES_DIR
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
 
 
 def load_schema_by_name(schema_name: str) -> dict[str, Any]:
@@ -32,10 +36,15 @@ def load_schema_by_name(schema_name: str) -> dict[str, Any]:
     return _load_json(path)
 
 
-@lru_cache
-def _schemas_by_id() -> dict[str, dict[str, Any]]:
+def _build_schemas_by_id() -> dict[str, dict[str, Any]]:
+    with os.scandir(schemas_dir()) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".schema.json")), key=lambda e: e.name
+        )
+
     out: dict[str, dict[str, Any]] = {}
-    for path in sorted(schemas_dir().glob("*.schema.json")):
+    for entry in entries:
+        path = Path(entry.path)
         doc = _load_json(path)
         schema_id = doc.get("$id")
         if not schema_id:
@@ -44,13 +53,25 @@ def _schemas_by_id() -> dict[str, dict[str, Any]]:
     return out
 
 
-@lru_cache
-def schema_registry() -> Registry:
-    """Registry for resolving `$ref` across our schema documents."""
+def _build_registry(schemas_by_id: dict[str, dict[str, Any]]) -> Registry:
     reg = Registry()
-    for schema_id, doc in _schemas_by_id().items():
+    for schema_id, doc in schemas_by_id.items():
         reg = reg.with_resource(
             schema_id, Resource.from_contents(doc, default_specification=DRAFT202012)
         )
     return reg
 
+
+# Built eagerly at import: schemas are static, and concurrent cold requests should not
+# race through the first load.
+_SCHEMAS_BY_ID = _build_schemas_by_id()
+_REGISTRY = _build_registry(_SCHEMAS_BY_ID)
+
+
+def _schemas_by_id() -> dict[str, dict[str, Any]]:
+    return _SCHEMAS_BY_ID
+
+
+def schema_registry() -> Registry:
+    """Registry for resolving `$ref` across our schema documents."""
+    return _REGISTRY
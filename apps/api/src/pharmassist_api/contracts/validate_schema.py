@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
-from .load_schema import load_schema_by_name, schema_registry
+from .load_schema import _schemas_by_id, load_schema_by_name, schema_registry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaValidationIssue:
     json_path: str
     message: str
@@ -22,24 +28,102 @@ class SchemaValidationFailed(Exception):
         self.issues = issues
 
 
+@lru_cache(maxsize=64)
+def _validator_for(schema_name: str) -> Draft202012Validator:
+    # Schemas are static; build each validator (and its ref resolution) only once.
+    return Draft202012Validator(load_schema_by_name(schema_name), registry=schema_registry())
+
+
+def _resolve_schema_uri(uri: str) -> dict[str, Any]:
+    return _schemas_by_id()[uri.split("#", 1)[0]]
+
+
+@lru_cache(maxsize=64)
+def _fast_validator_for(schema_name: str) -> Callable[[Any], Any] | None:
+    """Code-generated validator used as a fast accept path (optional `perf` extra).
+
+    Returns None when fastjsonschema is not installed or cannot compile the schema;
+    validation then relies on jsonschema alone.
+    """
+    try:
+        import fastjsonschema  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return fastjsonschema.compile(
+            load_schema_by_name(schema_name),
+            handlers={"pharmassist": _resolve_schema_uri},
+            use_default=False,
+        )
+    except Exception:  # noqa: BLE001 - unsupported schema features fall back to jsonschema
+        return None
+
+
 def validate_instance(instance: Any, schema_name: str) -> None:
     """Validate an instance against a named schema (raises on error)."""
-    schema = load_schema_by_name(schema_name)
-    validator = Draft202012Validator(schema, registry=schema_registry())
+    fast_validator = _fast_validator_for(schema_name)
+    if fast_validator is not None:
+        try:
+            fast_validator(instance)
+        except Exception:  # noqa: BLE001 - jsonschema below stays the source of truth
+            pass
+        else:
+            return
 
-    issues: list[SchemaValidationIssue] = []
-    for err in sorted(validator.iter_errors(instance), key=lambda e: str(e.json_path)):
-        issues.append(SchemaValidationIssue(json_path=str(err.json_path), message=err.message))
+    validator = _validator_for(schema_name)
+
+    errs = [(str(err.json_path), err.message) for err in validator.iter_errors(instance)]
+    errs.sort()
+    issues = [SchemaValidationIssue(json_path=path, message=msg) for path, msg in errs]
 
     if issues:
         raise SchemaValidationFailed(schema_name=schema_name, issues=issues)
 
 
-def validate_or_return_errors(instance: Any, schema_name: str) -> list[SchemaValidationIssue]:
+# (schema_name, content digest) pairs that recently validated clean. Only consulted by
+# callers that opt in with `cache_clean=True` (deterministic fragments rebuilt per run).
+_CLEAN_CACHE_MAX = 4096
+_CLEAN_CACHE: OrderedDict[tuple[str, bytes], None] = OrderedDict()
+_CLEAN_CACHE_LOCK = threading.Lock()
+
+
+def _content_digest(instance: Any) -> bytes | None:
+    try:
+        raw = orjson.dumps(instance, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def validate_or_return_errors(
+    instance: Any, schema_name: str, *, cache_clean: bool = False
+) -> list[SchemaValidationIssue]:
+    """Validate and return issues instead of raising.
+
+    With `cache_clean=True`, instances whose content already validated clean against
+    the same schema skip validation. The key is a digest of the serialized content,
+    so later mutation of the instance cannot produce a stale hit.
+    """
+    key = None
+    if cache_clean:
+        digest = _content_digest(instance)
+        if digest is not None:
+            key = (schema_name, digest)
+            with _CLEAN_CACHE_LOCK:
+                if key in _CLEAN_CACHE:
+                    _CLEAN_CACHE.move_to_end(key)
+                    return []
+
     try:
         validate_instance(instance, schema_name)
     except SchemaValidationFailed as e:
         return e.issues
     except ValidationError as e:
         return [SchemaValidationIssue(json_path=str(e.json_path), message=e.message)]
+
+    if key is not None:
+        with _CLEAN_CACHE_LOCK:
+            _CLEAN_CACHE[key] = None
+            if len(_CLEAN_CACHE) > _CLEAN_CACHE_MAX:
+                _CLEAN_CACHE.popitem(last=False)
     return []
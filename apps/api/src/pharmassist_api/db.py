@@ -1,15 +1,30 @@
 from __future__ import annotations
 
-import json
+import atexit
+import functools
+import itertools
 import os
 import sqlite3
-from datetime import UTC, datetime
+import threading
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
+import orjson
 
+
+def _dumps(value: Any) -> str:
+    # Compact UTF-8, like json.dumps(ensure_ascii=False, separators=(",", ":")).
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+
+@functools.cache
 def repo_root() -> Path:
-    # Locate the repository root robustly from this file location.
+    # Locate the repository root robustly from this file location (walked once).
     current = Path(__file__).resolve()
     for parent in current.parents:
         if (parent / "apps" / "api" / "src" / "pharmassist_api").exists() and (
@@ -21,7 +36,13 @@ def repo_root() -> Path:
 
 
 def db_path() -> Path:
-    env = os.getenv("PHARMASSIST_DB_PATH")
+    # PHARMASSIST_DB_PATH may change at runtime (tests use one DB per test), so the env
+    # var is read on every call; only the str -> Path construction is memoized.
+    return _db_path_for(os.getenv("PHARMASSIST_DB_PATH") or None)
+
+
+@functools.lru_cache(maxsize=8)
+def _db_path_for(env: str | None) -> Path:
     if env:
         return Path(env)
     return repo_root() / ".data" / "pharmassist.db"
@@ -55,6 +76,12 @@ def _should_enable_wal() -> bool:
     return True
 
 
+# Connections are long-lived (cached per thread), so keep every distinct SQL shape
+# prepared: the fixed queries, the update_run / analysis-state upsert variants and the
+# preview statements together exceed sqlite3's default of 100.
+_STATEMENT_CACHE_SIZE = 256
+
+
 def _connect() -> sqlite3.Connection:
     path = db_path()
     _ensure_parent_dir(path)
@@ -62,56 +89,360 @@ def _connect() -> sqlite3.Connection:
     # sqlite3.connect accepts PathLike, but convert explicitly to str to avoid
     # platform-specific edge cases (observed flakiness on some temp paths).
     #
-    # We also retry once: some environments can delete temp dirs during test runs
-    # (e.g. concurrent pytest sessions). Retrying after re-creating the parent dir
-    # makes tests and local dev more robust.
-    last_err: sqlite3.OperationalError | None = None
-    conn: sqlite3.Connection | None = None
-    for _attempt in range(2):
-        try:
-            conn = sqlite3.connect(str(path), check_same_thread=False)
-            break
-        except sqlite3.OperationalError as e:
-            last_err = e
-            _ensure_parent_dir(path)
-            conn = None
-    if conn is None:
-        assert last_err is not None
-        raise last_err
+    # This only runs when a thread first opens (or reopens) its cached connection, so
+    # the single retry below is off the per-query path. It covers environments that
+    # delete temp dirs during test runs (e.g. concurrent pytest sessions).
+    try:
+        conn = _open_rw(path)
+    except sqlite3.OperationalError:
+        _ensure_parent_dir(path)
+        conn = _open_rw(path)
+
+    conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn, readonly=False)
+    return conn
+
+
+def _open_rw(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(
+        str(path), check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+    )
+
 
+def _connect_readonly() -> sqlite3.Connection:
+    # `mode=ro`: SQLite opens the file read-only and never escalates to a write lock.
+    uri = f"{db_path().resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(
+        uri, uri=True, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+    )
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn, readonly=True)
+    return conn
+
+
+def _apply_pragmas(conn: sqlite3.Connection, *, readonly: bool) -> None:
+    if readonly:
+        conn.execute("PRAGMA query_only = ON;")
+    else:
+        _apply_write_pragmas(conn)
+    # Avoid transient "database is locked" errors under light concurrency.
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")  # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size = 268435456;")  # 256 MiB memory-mapped reads
+    conn.execute("PRAGMA trusted_schema = OFF;")
+
+
+def _apply_write_pragmas(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA foreign_keys = ON;")
     # Best-effort WAL mode (reduces lock contention). Some filesystems and
     # temp dirs are flaky with WAL, so we disable it under pytest and also
     # keep it best-effort in general.
     if _should_enable_wal():
         try:
-            conn.execute("PRAGMA journal_mode = WAL;")
+            mode = conn.execute("PRAGMA journal_mode = WAL;").fetchone()
         except sqlite3.OperationalError:
-            pass
-    # Avoid transient "database is locked" errors under light concurrency.
-    conn.execute("PRAGMA busy_timeout = 5000;")
+            mode = None
+        # NORMAL only fsyncs at checkpoints; that is still durable under WAL (but not
+        # under the rollback journal, so keep the FULL default otherwise).
+        if mode is not None and str(mode[0]).lower() == "wal":
+            conn.execute("PRAGMA synchronous = NORMAL;")
+
+
+# Cached connections per thread (pragmas applied once, at open): a read-write one and a
+# read-only one. Keyed by path so a changed PHARMASSIST_DB_PATH (tests use one DB per
+# test) transparently reopens, and by generation so connections closed by
+# `close_cached_connections` (app shutdown) are reopened instead of reused.
+_LOCAL = threading.local()
+_OPEN_CONNS: set[sqlite3.Connection] = set()
+_OPEN_CONNS_LOCK = threading.Lock()
+_CONN_GENERATION = 0
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's cached read-write connection to `db_path()`.
+
+    Use as `with _get_conn() as conn:`: the context manager commits (or rolls back)
+    the pending transaction but leaves the connection open for reuse.
+    """
+    return _cached_conn("rw", _connect, str(db_path()))
+
+
+def _read_conn() -> sqlite3.Connection:
+    """Return this thread's cached read-only connection (for get/list/count paths).
+
+    Falls back to the read-write connection while the DB file does not exist yet.
+    """
+    path = db_path()
+    cached: tuple[str, int, sqlite3.Connection] | None = getattr(_LOCAL, "ro", None)
+    if cached is not None and cached[0] == str(path) and cached[1] == _CONN_GENERATION:
+        # Already open on this path: skip the per-call exists() stat.
+        return cached[2]
+    if not path.exists():
+        return _get_conn()
+    return _cached_conn("ro", _connect_readonly, str(path))
+
+
+def _cached_conn(
+    slot: str, opener: Callable[[], sqlite3.Connection], path: str
+) -> sqlite3.Connection:
+    cached: tuple[str, int, sqlite3.Connection] | None = getattr(_LOCAL, slot, None)
+    if cached is not None and cached[0] == path and cached[1] == _CONN_GENERATION:
+        return cached[2]
+    if cached is not None:
+        _close_conn(cached[2])
+
+    conn = opener()
+    setattr(_LOCAL, slot, (path, _CONN_GENERATION, conn))
+    with _OPEN_CONNS_LOCK:
+        _OPEN_CONNS.add(conn)
     return conn
 
 
+def _close_conn(conn: sqlite3.Connection) -> None:
+    with _OPEN_CONNS_LOCK:
+        _OPEN_CONNS.discard(conn)
+    _optimize_and_close(conn)
+
+
+def _optimize_and_close(conn: sqlite3.Connection) -> None:
+    # SQLite recommends `PRAGMA optimize` before closing a long-lived connection: it
+    # refreshes planner statistics only for tables whose queries would benefit.
+    # Best-effort (read-only connections cannot write sqlite_stat1).
+    try:
+        conn.execute("PRAGMA optimize;")
+    except sqlite3.Error:
+        pass
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _fetchall_tuples(
+    conn: sqlite3.Connection, sql: str, params: tuple[Any, ...] | list[Any] = ()
+) -> list[tuple[Any, ...]]:
+    """Run a query returning plain tuples (index by position) instead of `sqlite3.Row`.
+
+    For row-mapping loops on hot read paths; the connection's row factory is untouched.
+    """
+    return _iter_tuples(conn, sql, params).fetchall()
+
+
+def _iter_tuples(
+    conn: sqlite3.Connection, sql: str, params: tuple[Any, ...] | list[Any] = ()
+) -> sqlite3.Cursor:
+    """Like `_fetchall_tuples`, but return the cursor so rows are read one at a time.
+
+    For building results straight off the cursor without also holding the raw rows.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur.execute(sql, params)
+
+
+@atexit.register
+def close_cached_connections() -> None:
+    """Close every thread's cached connection (app shutdown / interpreter exit).
+
+    Threads that query again afterwards transparently open fresh connections.
+    """
+    global _CONN_GENERATION
+    with _OPEN_CONNS_LOCK:
+        conns = list(_OPEN_CONNS)
+        _OPEN_CONNS.clear()
+        _CONN_GENERATION += 1
+    for conn in conns:
+        _optimize_and_close(conn)
+
+
 def init_db() -> None:
-    with _connect() as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS runs (
-              run_id TEXT PRIMARY KEY,
-              created_at TEXT NOT NULL,
-              updated_at TEXT NOT NULL,
-              status TEXT NOT NULL,
-              input_json TEXT NOT NULL,
-              artifacts_json TEXT NOT NULL,
-              policy_violations_json TEXT NOT NULL
-            );
-            """
-        )
+    init_schema()
+    init_indexes()
+
+
+_COUNTED_TABLES = ("patients", "visits", "inventory", "documents")
+
+
+def _recompute_latest_visit_sql(ref: str) -> str:
+    # Trigger body fragment: rebuild one patient's latest-visit row from visits.
+    return f"""
+      DELETE FROM patient_latest_visit WHERE patient_ref = {ref}.patient_ref;
+      INSERT INTO patient_latest_visit(patient_ref, occurred_at)
+      SELECT patient_ref, MAX(occurred_at) FROM visits
+      WHERE patient_ref = {ref}.patient_ref
+      GROUP BY patient_ref;"""
+
+
+def _row_count_triggers_sql(table: str) -> str:
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS trg_{table}_row_count_insert
+    AFTER INSERT ON {table}
+    BEGIN
+      UPDATE table_row_counts SET row_count = row_count + 1 WHERE table_name = '{table}';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_{table}_row_count_delete
+    AFTER DELETE ON {table}
+    BEGIN
+      UPDATE table_row_counts SET row_count = row_count - 1 WHERE table_name = '{table}';
+    END;
+    """
 
-        # Migration: older versions stored run SSE events in a table named `events`.
-        # We now reserve `events` for the pharmacy dataset and store run events in `run_events`.
+
+# Static schema DDL, run as one script (one parse pass, one transaction).
+_SCHEMA_SQL = (
+    """
+    BEGIN;
+
+    CREATE TABLE IF NOT EXISTS runs (
+      run_id TEXT PRIMARY KEY,
+      created_at TEXT NOT NULL,
+      updated_at TEXT NOT NULL,
+      status TEXT NOT NULL,
+      input_json TEXT NOT NULL,
+      artifacts_json TEXT NOT NULL,
+      policy_violations_json TEXT NOT NULL,
+      patient_ref TEXT,
+      run_trigger TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS run_events (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      run_id TEXT NOT NULL,
+      ts TEXT NOT NULL,
+      type TEXT NOT NULL,
+      data_json TEXT NOT NULL,
+      FOREIGN KEY(run_id) REFERENCES runs(run_id)
+    );
+    -- Drop any legacy index name that might conflict with dataset tables.
+    DROP INDEX IF EXISTS idx_events_run_id_id;
+
+    -- Superseded by the (ref, occurred_at) composite indexes on events.
+    DROP INDEX IF EXISTS idx_events_visit_ref;
+    DROP INDEX IF EXISTS idx_events_patient_ref;
+
+    -- Synthetic pharmacy dataset tables (Feb 6 step-up).
+    CREATE TABLE IF NOT EXISTS patients (
+      patient_ref TEXT PRIMARY KEY,
+      llm_context_json TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS visits (
+      visit_ref TEXT PRIMARY KEY,
+      patient_ref TEXT NOT NULL,
+      occurred_at TEXT NOT NULL,
+      primary_domain TEXT,
+      intents_json TEXT NOT NULL,
+      intake_extracted_json TEXT NOT NULL,
+      FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
+    );
+
+    CREATE TABLE IF NOT EXISTS events (
+      event_ref TEXT PRIMARY KEY,
+      visit_ref TEXT NOT NULL,
+      patient_ref TEXT NOT NULL,
+      occurred_at TEXT NOT NULL,
+      event_type TEXT NOT NULL,
+      payload_json TEXT NOT NULL,
+      FOREIGN KEY(visit_ref) REFERENCES visits(visit_ref),
+      FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
+    );
+
+    CREATE TABLE IF NOT EXISTS inventory (
+      sku TEXT PRIMARY KEY,
+      product_json TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS documents (
+      doc_ref TEXT PRIMARY KEY,
+      metadata_json TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS patient_analysis_state (
+      patient_ref TEXT PRIMARY KEY,
+      status TEXT NOT NULL,
+      updated_at TEXT NOT NULL,
+      last_run_id TEXT,
+      last_error TEXT,
+      changed_since_last_analysis INTEGER NOT NULL DEFAULT 0,
+      refresh_reason TEXT,
+      FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
+    );
+
+    CREATE TABLE IF NOT EXISTS admin_audit_events (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      ts TEXT NOT NULL,
+      endpoint TEXT NOT NULL,
+      method TEXT NOT NULL,
+      client_ip TEXT NOT NULL,
+      action TEXT NOT NULL,
+      reason TEXT NOT NULL,
+      meta_json TEXT NOT NULL
+    );
+
+    -- Latest visit time per patient (inbox ordering), maintained by triggers on visits.
+    CREATE TABLE IF NOT EXISTS patient_latest_visit (
+      patient_ref TEXT PRIMARY KEY,
+      occurred_at TEXT NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_visits_latest_insert
+    AFTER INSERT ON visits
+    BEGIN
+      INSERT INTO patient_latest_visit(patient_ref, occurred_at)
+      VALUES (NEW.patient_ref, NEW.occurred_at)
+      ON CONFLICT(patient_ref) DO UPDATE SET
+        occurred_at = MAX(occurred_at, excluded.occurred_at);
+    END;
+    """
+    + f"""
+    CREATE TRIGGER IF NOT EXISTS trg_visits_latest_update
+    AFTER UPDATE OF patient_ref, occurred_at ON visits
+    WHEN OLD.patient_ref IS NOT NEW.patient_ref OR OLD.occurred_at IS NOT NEW.occurred_at
+    BEGIN{_recompute_latest_visit_sql("OLD")}{_recompute_latest_visit_sql("NEW")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_visits_latest_delete
+    AFTER DELETE ON visits
+    BEGIN{_recompute_latest_visit_sql("OLD")}
+    END;
+
+    -- Row counts for the dashboard counters, maintained by triggers so count_*() is a
+    -- primary-key read instead of a full COUNT scan.
+    CREATE TABLE IF NOT EXISTS table_row_counts (
+      table_name TEXT PRIMARY KEY,
+      row_count INTEGER NOT NULL
+    );
+    """
+    + "".join(_row_count_triggers_sql(table) for table in _COUNTED_TABLES)
+    + """
+    COMMIT;
+    """
+)
+
+
+# One-shot migrations, recorded in `schema_migrations` so later init_db() calls skip
+# their catalog checks. Ids are permanent: append new ones, never renumber.
+_MIGRATION_RENAME_LEGACY_RUN_EVENTS = 1
+_MIGRATION_RUNS_PATIENT_COLUMNS = 2
+_MIGRATION_SEED_PATIENT_LATEST_VISIT = 3
+
+
+def init_schema() -> None:
+    """Create tables (and run legacy migrations). Secondary indexes: `init_indexes`."""
+    conn = _get_conn()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+          id INTEGER PRIMARY KEY,
+          applied_at TEXT NOT NULL
+        );
+        """
+    )
+    applied = {int(r["id"]) for r in conn.execute("SELECT id FROM schema_migrations")}
+    newly_applied: list[int] = []
+
+    if _MIGRATION_RENAME_LEGACY_RUN_EVENTS not in applied:
+        # Older versions stored run SSE events in a table named `events`. We now
+        # reserve `events` for the pharmacy dataset and store run events in `run_events`.
         has_events = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='events'"
         ).fetchone()
@@ -121,132 +452,227 @@ def init_db() -> None:
         if has_events and not has_run_events:
             cols = [r["name"] for r in conn.execute("PRAGMA table_info(events)").fetchall()]
             if {"run_id", "data_json"} <= set(cols):
-                conn.execute("ALTER TABLE events RENAME TO run_events;")
+                with conn:
+                    conn.execute("ALTER TABLE events RENAME TO run_events;")
+        newly_applied.append(_MIGRATION_RENAME_LEGACY_RUN_EVENTS)
+
+    conn.executescript(_SCHEMA_SQL)
+
+    with conn:
+        if _MIGRATION_RUNS_PATIENT_COLUMNS not in applied:
+            # `patient_ref` / `run_trigger` mirror input_json so per-patient run lookups
+            # can use an index instead of json_extract over every row.
+            run_cols = {r["name"] for r in conn.execute("PRAGMA table_info(runs)").fetchall()}
+            if "patient_ref" not in run_cols:
+                conn.execute("ALTER TABLE runs ADD COLUMN patient_ref TEXT;")
+            if "run_trigger" not in run_cols:
+                conn.execute("ALTER TABLE runs ADD COLUMN run_trigger TEXT;")
+            if not {"patient_ref", "run_trigger"} <= run_cols:
+                conn.execute(
+                    """
+                    UPDATE runs SET
+                      patient_ref = json_extract(input_json, '$.patient_ref'),
+                      run_trigger = json_extract(input_json, '$.trigger')
+                    """
+                )
+            newly_applied.append(_MIGRATION_RUNS_PATIENT_COLUMNS)
+
+        if _MIGRATION_SEED_PATIENT_LATEST_VISIT not in applied:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO patient_latest_visit(patient_ref, occurred_at)
+                SELECT patient_ref, MAX(occurred_at) FROM visits GROUP BY patient_ref
+                """
+            )
+            newly_applied.append(_MIGRATION_SEED_PATIENT_LATEST_VISIT)
+
+        # Seed counters once, after their triggers exist, so no concurrent insert is missed.
+        for table in _COUNTED_TABLES:
+            conn.execute(
+                f"""
+                INSERT INTO table_row_counts(table_name, row_count)
+                SELECT '{table}', (SELECT COUNT(1) FROM {table})
+                WHERE NOT EXISTS (
+                  SELECT 1 FROM table_row_counts WHERE table_name = '{table}'
+                )
+                """
+            )
 
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS run_events (
-              id INTEGER PRIMARY KEY AUTOINCREMENT,
-              run_id TEXT NOT NULL,
-              ts TEXT NOT NULL,
-              type TEXT NOT NULL,
-              data_json TEXT NOT NULL,
-              FOREIGN KEY(run_id) REFERENCES runs(run_id)
-            );
-            """
-        )
-        # Drop any legacy index name that might conflict with dataset tables.
-        conn.execute("DROP INDEX IF EXISTS idx_events_run_id_id;")
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_run_events_run_id_id ON run_events(run_id, id);"
-        )
+        if newly_applied:
+            applied_at = now_iso()
+            conn.executemany(
+                "INSERT OR IGNORE INTO schema_migrations(id, applied_at) VALUES (?, ?)",
+                [(migration_id, applied_at) for migration_id in newly_applied],
+            )
 
-        # Synthetic pharmacy dataset tables (Feb 6 step-up).
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS patients (
-              patient_ref TEXT PRIMARY KEY,
-              llm_context_json TEXT NOT NULL
-            );
-            """
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS visits (
-              visit_ref TEXT PRIMARY KEY,
-              patient_ref TEXT NOT NULL,
-              occurred_at TEXT NOT NULL,
-              primary_domain TEXT,
-              intents_json TEXT NOT NULL,
-              intake_extracted_json TEXT NOT NULL,
-              FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
-            );
-            """
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_visits_patient_ref_occurred_at "
-            "ON visits(patient_ref, occurred_at);"
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS events (
-              event_ref TEXT PRIMARY KEY,
-              visit_ref TEXT NOT NULL,
-              patient_ref TEXT NOT NULL,
-              occurred_at TEXT NOT NULL,
-              event_type TEXT NOT NULL,
-              payload_json TEXT NOT NULL,
-              FOREIGN KEY(visit_ref) REFERENCES visits(visit_ref),
-              FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
-            );
-            """
-        )
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_events_visit_ref ON events(visit_ref);")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_events_patient_ref ON events(patient_ref);")
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS inventory (
-              sku TEXT PRIMARY KEY,
-              product_json TEXT NOT NULL
-            );
-            """
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS documents (
-              doc_ref TEXT PRIMARY KEY,
-              metadata_json TEXT NOT NULL
-            );
-            """
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS patient_analysis_state (
-              patient_ref TEXT PRIMARY KEY,
-              status TEXT NOT NULL,
-              updated_at TEXT NOT NULL,
-              last_run_id TEXT,
-              last_error TEXT,
-              changed_since_last_analysis INTEGER NOT NULL DEFAULT 0,
-              refresh_reason TEXT,
-              FOREIGN KEY(patient_ref) REFERENCES patients(patient_ref)
-            );
-            """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_patient_analysis_state_status
-            ON patient_analysis_state(status, updated_at DESC);
-            """
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS admin_audit_events (
-              id INTEGER PRIMARY KEY AUTOINCREMENT,
-              ts TEXT NOT NULL,
-              endpoint TEXT NOT NULL,
-              method TEXT NOT NULL,
-              client_ip TEXT NOT NULL,
-              action TEXT NOT NULL,
-              reason TEXT NOT NULL,
-              meta_json TEXT NOT NULL
-            );
-            """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_admin_audit_events_ts
-            ON admin_audit_events(ts DESC, id DESC);
-            """
-        )
+
+# (table, index name, DDL). Kept separate from the table DDL so bulk loads can drop
+# them, insert without per-row B-tree maintenance, then rebuild once.
+_SECONDARY_INDEXES: tuple[tuple[str, str, str], ...] = (
+    (
+        "runs",
+        "idx_runs_patient_ref_created_at",
+        "CREATE INDEX IF NOT EXISTS idx_runs_patient_ref_created_at "
+        "ON runs(patient_ref, created_at DESC, run_id DESC);",
+    ),
+    (
+        "run_events",
+        "idx_run_events_run_id_id",
+        "CREATE INDEX IF NOT EXISTS idx_run_events_run_id_id ON run_events(run_id, id);",
+    ),
+    (
+        "visits",
+        "idx_visits_patient_ref_occurred_at",
+        "CREATE INDEX IF NOT EXISTS idx_visits_patient_ref_occurred_at "
+        "ON visits(patient_ref, occurred_at);",
+    ),
+    (
+        "patient_latest_visit",
+        "idx_patient_latest_visit_occurred_at",
+        "CREATE INDEX IF NOT EXISTS idx_patient_latest_visit_occurred_at "
+        "ON patient_latest_visit(occurred_at DESC, patient_ref ASC);",
+    ),
+    # Timeline lookups (per patient / per visit, newest first) without a temp sort. These
+    # also serve plain equality lookups, replacing the former single-column indexes.
+    (
+        "events",
+        "idx_events_patient_ref_occurred_at",
+        "CREATE INDEX IF NOT EXISTS idx_events_patient_ref_occurred_at "
+        "ON events(patient_ref, occurred_at DESC);",
+    ),
+    (
+        "events",
+        "idx_events_visit_ref_occurred_at",
+        "CREATE INDEX IF NOT EXISTS idx_events_visit_ref_occurred_at "
+        "ON events(visit_ref, occurred_at DESC);",
+    ),
+    (
+        "patient_analysis_state",
+        "idx_patient_analysis_state_status",
+        "CREATE INDEX IF NOT EXISTS idx_patient_analysis_state_status "
+        "ON patient_analysis_state(status, updated_at DESC);",
+    ),
+    (
+        "admin_audit_events",
+        "idx_admin_audit_events_ts",
+        "CREATE INDEX IF NOT EXISTS idx_admin_audit_events_ts "
+        "ON admin_audit_events(ts DESC, id DESC);",
+    ),
+    # Prefix search (`col LIKE 'q%'`, case-insensitive by default) can only seek an
+    # index with NOCASE collation; the BINARY primary keys do not qualify. Every column
+    # ORed in a preview filter needs one, or the whole filter falls back to a scan. Not
+    # added for run_events (hot SSE insert path) or inventory (also matches
+    # `product_json LIKE '%q%'`, which scans regardless).
+    (
+        "runs",
+        "idx_runs_run_id_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_runs_run_id_nocase "
+        "ON runs(run_id COLLATE NOCASE);",
+    ),
+    (
+        "patients",
+        "idx_patients_patient_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_patients_patient_ref_nocase "
+        "ON patients(patient_ref COLLATE NOCASE);",
+    ),
+    (
+        "visits",
+        "idx_visits_visit_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_visits_visit_ref_nocase "
+        "ON visits(visit_ref COLLATE NOCASE);",
+    ),
+    (
+        "visits",
+        "idx_visits_patient_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_visits_patient_ref_nocase "
+        "ON visits(patient_ref COLLATE NOCASE);",
+    ),
+    (
+        "events",
+        "idx_events_event_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_events_event_ref_nocase "
+        "ON events(event_ref COLLATE NOCASE);",
+    ),
+    (
+        "events",
+        "idx_events_visit_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_events_visit_ref_nocase "
+        "ON events(visit_ref COLLATE NOCASE);",
+    ),
+    (
+        "events",
+        "idx_events_patient_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_events_patient_ref_nocase "
+        "ON events(patient_ref COLLATE NOCASE);",
+    ),
+    (
+        "events",
+        "idx_events_event_type_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_events_event_type_nocase "
+        "ON events(event_type COLLATE NOCASE);",
+    ),
+    (
+        "documents",
+        "idx_documents_doc_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_documents_doc_ref_nocase "
+        "ON documents(doc_ref COLLATE NOCASE);",
+    ),
+    (
+        "patient_analysis_state",
+        "idx_patient_analysis_state_patient_ref_nocase",
+        "CREATE INDEX IF NOT EXISTS idx_patient_analysis_state_patient_ref_nocase "
+        "ON patient_analysis_state(patient_ref COLLATE NOCASE);",
+    ),
+)
+
+
+def init_indexes() -> None:
+    create_secondary_indexes()
+
+
+def _executescript_in_transaction(statements: list[str]) -> None:
+    # sqlite3 never opens an implicit transaction for DDL, so executing statements one by
+    # one commits (and syncs) after each. One BEGIN/COMMIT script writes them all at once.
+    if statements:
+        _get_conn().executescript("\n".join(["BEGIN;", *statements, "COMMIT;"]))
+
+
+def create_secondary_indexes(*, tables: tuple[str, ...] | None = None) -> None:
+    _executescript_in_transaction(
+        [ddl for table, _name, ddl in _SECONDARY_INDEXES if tables is None or table in tables]
+    )
+
+
+def drop_secondary_indexes(*, tables: tuple[str, ...] | None = None) -> None:
+    """Drop secondary indexes (e.g. before a bulk load); restore with
+    `create_secondary_indexes` using the same `tables`."""
+    _executescript_in_transaction(
+        [
+            f"DROP INDEX IF EXISTS {name};"
+            for table, name, _ddl in _SECONDARY_INDEXES
+            if tables is None or table in tables
+        ]
+    )
 
 
 def now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    """Current UTC time as ISO 8601 with microseconds (`...T12:34:56.789012+00:00`).
+
+    Called for every run event and run update: the date/time part is formatted once per
+    second (cached) and only the sub-second part is appended per call, instead of
+    building and formatting an aware datetime each time.
+    """
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{_iso_second(seconds)}.{micros:06d}+00:00"
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
 
 
 def create_run(run: dict[str, Any]) -> None:
-    with _connect() as conn:
+    with _get_conn() as conn:
         conn.execute(
             """
             INSERT INTO runs(
@@ -256,24 +682,32 @@ def create_run(run: dict[str, Any]) -> None:
               status,
               input_json,
               artifacts_json,
-              policy_violations_json
+              policy_violations_json,
+              patient_ref,
+              run_trigger
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 run["run_id"],
                 run["created_at"],
                 run["created_at"],
                 run["status"],
-                json.dumps(run["input"], ensure_ascii=False, separators=(",", ":")),
-                json.dumps(run["artifacts"], ensure_ascii=False, separators=(",", ":")),
-                json.dumps(run["policy_violations"], ensure_ascii=False, separators=(",", ":")),
+                _dumps(run["input"]),
+                _dumps(run["artifacts"]),
+                _dumps(run["policy_violations"]),
+                _str_or_none(run["input"].get("patient_ref")),
+                _str_or_none(run["input"].get("trigger")),
             ),
         )
 
 
+def _str_or_none(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
 def get_run(run_id: str) -> dict[str, Any] | None:
-    with _connect() as conn:
+    with _read_conn() as conn:
         row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
         if not row:
             return None
@@ -282,12 +716,63 @@ def get_run(run_id: str) -> dict[str, Any] | None:
             "run_id": row["run_id"],
             "created_at": row["created_at"],
             "status": row["status"],
-            "input": json.loads(row["input_json"]),
-            "artifacts": json.loads(row["artifacts_json"]),
-            "policy_violations": json.loads(row["policy_violations_json"]),
+            "input": _loads(row["input_json"]),
+            "artifacts": _loads(row["artifacts_json"]),
+            "policy_violations": _loads(row["policy_violations_json"]),
         }
 
 
+_SQL_GET_RUN_JSON = """
+    SELECT json_object(
+      'schema_version', '0.0.0',
+      'run_id', run_id,
+      'created_at', created_at,
+      'status', status,
+      'input', json(input_json),
+      'artifacts', json(artifacts_json),
+      'policy_violations', json(policy_violations_json)
+    )
+    FROM runs
+    WHERE run_id = ?
+"""
+
+
+def get_run_json(run_id: str) -> str | None:
+    """`get_run` as a JSON document, assembled by SQLite (JSON1).
+
+    For routes that return the run unchanged: the stored JSON columns are spliced into
+    the response without being decoded and re-encoded in Python.
+    """
+    with _read_conn() as conn:
+        row = _iter_tuples(conn, _SQL_GET_RUN_JSON, (run_id,)).fetchone()
+    return row[0] if row else None
+
+
+def run_exists(run_id: str) -> bool:
+    with _read_conn() as conn:
+        row = conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    return row is not None
+
+
+def get_run_status(run_id: str) -> str | None:
+    """Just the run's status (no JSON columns read or parsed); None if unknown."""
+    with _read_conn() as conn:
+        row = conn.execute("SELECT status FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    return row[0] if row else None
+
+
+def _update_run_sql(key: tuple[bool, bool, bool]) -> str:
+    columns = ("status", "artifacts_json", "policy_violations_json")
+    sets = ["updated_at = ?", *(f"{col} = ?" for col, on in zip(columns, key, strict=True) if on)]
+    return f"UPDATE runs SET {', '.join(sets)} WHERE run_id = ?"
+
+
+# Keyed by (has_status, has_artifacts, has_policy_violations).
+_SQL_UPDATE_RUN: dict[tuple[bool, bool, bool], str] = {
+    key: _update_run_sql(key) for key in itertools.product((False, True), repeat=3)
+}
+
+
 def update_run(
     run_id: str,
     *,
@@ -295,59 +780,112 @@ def update_run(
     artifacts: dict[str, Any] | None = None,
     policy_violations: list[dict[str, Any]] | None = None,
 ) -> None:
-    updates: list[str] = ["updated_at = ?"]
     params: list[Any] = [now_iso()]
-
     if status is not None:
-        updates.append("status = ?")
         params.append(status)
-
     if artifacts is not None:
-        updates.append("artifacts_json = ?")
-        params.append(json.dumps(artifacts, ensure_ascii=False, separators=(",", ":")))
-
+        params.append(_dumps(artifacts))
     if policy_violations is not None:
-        updates.append("policy_violations_json = ?")
-        params.append(json.dumps(policy_violations, ensure_ascii=False, separators=(",", ":")))
-
+        params.append(_dumps(policy_violations))
     params.append(run_id)
 
-    with _connect() as conn:
-        conn.execute(f"UPDATE runs SET {', '.join(updates)} WHERE run_id = ?", params)
+    key = (status is not None, artifacts is not None, policy_violations is not None)
+    sql = _SQL_UPDATE_RUN[key]
+    with _get_conn() as conn:
+        conn.execute(sql, params)
 
 
-def insert_event(run_id: str, event_type: str, payload: dict[str, Any]) -> int:
-    ts = payload.get("ts") or now_iso()
-    payload = {**payload, "ts": ts, "type": event_type}
+_SQL_INSERT_RUN_EVENT = """
+    INSERT INTO run_events(run_id, ts, type, data_json)
+    VALUES (?, ?, ?, ?)
+"""
 
-    with _connect() as conn:
-        cur = conn.execute(
-            """
-            INSERT INTO run_events(run_id, ts, type, data_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                run_id,
-                ts,
-                event_type,
-                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
-            ),
-        )
+
+def _run_event_row(
+    run_id: str, event_type: str, payload: dict[str, Any]
+) -> tuple[str, str, str, str]:
+    ts = payload.get("ts")
+    # The orchestrator already stamps ts/type; only copy when they are missing (the
+    # merge below would then produce an identical dict, key order included).
+    if not ts or payload.get("type") != event_type:
+        ts = ts or now_iso()
+        payload = {**payload, "ts": ts, "type": event_type}
+    return (
+        run_id,
+        ts,
+        event_type,
+        _dumps(payload),
+    )
+
+
+def insert_event(run_id: str, event_type: str, payload: dict[str, Any]) -> int:
+    with _get_conn() as conn:
+        cur = conn.execute(_SQL_INSERT_RUN_EVENT, _run_event_row(run_id, event_type, payload))
         return int(cur.lastrowid)
 
 
-def list_events(run_id: str, *, after_id: int = 0) -> list[dict[str, Any]]:
-    with _connect() as conn:
-        rows = conn.execute(
-            "SELECT id, data_json FROM run_events WHERE run_id = ? AND id > ? ORDER BY id ASC",
-            (run_id, after_id),
-        ).fetchall()
+def insert_events(run_id: str, events: list[tuple[str, dict[str, Any]]]) -> list[int]:
+    """Insert several `(event_type, payload)` events in one transaction.
+
+    Returns the new event ids in insertion order.
+    """
+    if not events:
+        return []
+    rows = [_run_event_row(run_id, event_type, payload) for event_type, payload in events]
+    with _get_conn() as conn:
+        conn.executemany(_SQL_INSERT_RUN_EVENT, rows)
+        # The write lock is held for the whole transaction, so AUTOINCREMENT ids
+        # for this batch are contiguous.
+        last_id = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+    first_id = last_id - len(rows) + 1
+    return list(range(first_id, last_id + 1))
+
+
+# Served by idx_run_events_run_id_id: `id` is the rowid, so each match costs one extra
+# rowid seek. A covering (run_id, id, data_json) index would store every payload twice
+# and slow down the hot event-insert path for little gain.
+_SQL_LIST_RUN_EVENTS = (
+    "SELECT id, type, data_json FROM run_events"
+    " WHERE run_id = ? AND id > ? ORDER BY id ASC LIMIT ?"
+)
+_EVENTS_PAGE_SIZE = 256
+
+
+def iter_events(run_id: str, *, after_id: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield run events (`{"id", "data"}`) in id order."""
+    for event_id, _event_type, data_json in iter_event_rows(run_id, after_id=after_id):
+        yield {"id": event_id, "data": _loads(data_json)}
+
+
+def iter_event_rows(run_id: str, *, after_id: int = 0) -> Iterator[tuple[int, str, str]]:
+    """Yield raw `(id, type, data_json)` run event rows in id order (no JSON decode).
+
+    Rows are fetched in pages of `_EVENTS_PAGE_SIZE`; each page is its own short query
+    (keyset on `id`), so no cursor or read snapshot is held open while the consumer is
+    suspended.
+    """
+    last_id = after_id
+    while True:
+        rows = list_event_rows(run_id, after_id=last_id, limit=_EVENTS_PAGE_SIZE)
+        yield from rows
+        if len(rows) < _EVENTS_PAGE_SIZE:
+            return
+        last_id = rows[-1][0]
+
+
+def list_event_rows(run_id: str, *, after_id: int, limit: int) -> list[tuple[int, str, str]]:
+    """One page of raw `(id, type, data_json)` run event rows with `id > after_id`.
+
+    For forwarding stored events verbatim (SSE replay). A single blocking query, so
+    async callers can run each page in a worker thread (`asyncio.to_thread`).
+    """
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(conn, _SQL_LIST_RUN_EVENTS, (run_id, after_id, limit))
+    return [(int(row[0]), row[1], row[2]) for row in rows]
+
 
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        data = json.loads(row["data_json"])
-        out.append({"id": int(row["id"]), "data": data})
-    return out
+def list_events(run_id: str, *, after_id: int = 0) -> list[dict[str, Any]]:
+    return list(iter_events(run_id, after_id=after_id))
 
 
 def insert_admin_audit_event(
@@ -360,7 +898,7 @@ def insert_admin_audit_event(
     meta: dict[str, Any] | None = None,
 ) -> None:
     payload = meta if isinstance(meta, dict) else {}
-    with _connect() as conn:
+    with _get_conn() as conn:
         conn.execute(
             """
             INSERT INTO admin_audit_events(
@@ -381,14 +919,15 @@ def insert_admin_audit_event(
                 client_ip.strip(),
                 action.strip().lower(),
                 reason.strip().lower(),
-                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                _dumps(payload),
             ),
         )
 
 
 def list_admin_audit_events(*, limit: int = 200) -> list[dict[str, Any]]:
-    with _connect() as conn:
-        rows = conn.execute(
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(
+            conn,
             """
             SELECT id, ts, endpoint, method, client_ip, action, reason, meta_json
             FROM admin_audit_events
@@ -396,43 +935,44 @@ def list_admin_audit_events(*, limit: int = 200) -> list[dict[str, Any]]:
             LIMIT ?
             """,
             (int(limit),),
-        ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        out.append(
-            {
-                "id": int(row["id"]),
-                "ts": row["ts"],
-                "endpoint": row["endpoint"],
-                "method": row["method"],
-                "client_ip": row["client_ip"],
-                "action": row["action"],
-                "reason": row["reason"],
-                "meta": _json_load_object(row["meta_json"]),
-            }
         )
-    return out
+
+    return [
+        {
+            "id": int(row[0]),
+            "ts": row[1],
+            "endpoint": row[2],
+            "method": row[3],
+            "client_ip": row[4],
+            "action": row[5],
+            "reason": row[6],
+            "meta": _loads(row[7]),
+        }
+        for row in rows
+    ]
+
+
+_SQL_UPSERT_PATIENT = """
+    INSERT INTO patients(patient_ref, llm_context_json)
+    VALUES(?, ?)
+    ON CONFLICT(patient_ref) DO UPDATE SET
+      llm_context_json = excluded.llm_context_json
+"""
 
 
 def upsert_patient(*, patient_ref: str, llm_context: dict[str, Any]) -> None:
-    with _connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO patients(patient_ref, llm_context_json)
-            VALUES(?, ?)
-            ON CONFLICT(patient_ref) DO UPDATE SET
-              llm_context_json = excluded.llm_context_json
-            """,
-            (
-                patient_ref,
-                json.dumps(llm_context, ensure_ascii=False, separators=(",", ":")),
-            ),
-        )
+    upsert_patients([(patient_ref, llm_context)])
+
+
+def upsert_patients(patients: list[tuple[str, dict[str, Any]]]) -> None:
+    """Upsert several `(patient_ref, llm_context)` rows in one transaction."""
+    rows = [(patient_ref, _dumps(llm_context)) for patient_ref, llm_context in patients]
+    with _get_conn() as conn:
+        conn.executemany(_SQL_UPSERT_PATIENT, rows)
 
 
 def get_patient(patient_ref: str) -> dict[str, Any] | None:
-    with _connect() as conn:
+    with _read_conn() as conn:
         row = conn.execute(
             "SELECT patient_ref, llm_context_json FROM patients WHERE patient_ref = ?",
             (patient_ref,),
@@ -441,39 +981,70 @@ def get_patient(patient_ref: str) -> dict[str, Any] | None:
             return None
         return {
             "patient_ref": row["patient_ref"],
-            "llm_context": json.loads(row["llm_context_json"]),
+            "llm_context": _loads(row["llm_context_json"]),
         }
 
 
+def patient_exists(patient_ref: str) -> bool:
+    with _read_conn() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM patients WHERE patient_ref = ?", (patient_ref,)
+        ).fetchone()
+    return row is not None
+
+
+# Demographics are extracted inside SQLite (JSON1) so only that fragment crosses into
+# Python and gets parsed, not the whole llm_context.
+#
+# LIKE is case-insensitive, so the prefix seeks idx_patients_patient_ref_nocase; ordering
+# by the same NOCASE key lets that index also deliver the order, so the scan stops after
+# `limit` rows instead of sorting (and projecting) every match. The BINARY tiebreak keeps
+# the result deterministic.
+_SQL_SEARCH_PATIENTS = """
+    SELECT
+      patient_ref,
+      CASE
+        WHEN json_type(llm_context_json, '$.demographics') = 'object'
+        THEN json_extract(llm_context_json, '$.demographics')
+      END
+    FROM patients
+    WHERE patient_ref LIKE ?
+    ORDER BY patient_ref COLLATE NOCASE ASC, patient_ref ASC
+    LIMIT ?
+"""
+
+
 def search_patients(*, query_prefix: str, limit: int = 20) -> list[dict[str, Any]]:
     q = (query_prefix or "").strip()
     if not q:
         return []
 
-    like = f"{q}%"
-    with _connect() as conn:
-        rows = conn.execute(
-            """
-            SELECT patient_ref, llm_context_json
-            FROM patients
-            WHERE patient_ref LIKE ?
-            ORDER BY patient_ref ASC
-            LIMIT ?
-            """,
-            (like, int(limit)),
-        ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for r in rows:
-        llm_context = json.loads(r["llm_context_json"])
-        demo = llm_context.get("demographics") if isinstance(llm_context, dict) else None
-        out.append(
-            {
-                "patient_ref": r["patient_ref"],
-                "demographics": demo if isinstance(demo, dict) else {},
-            }
-        )
-    return out
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(conn, _SQL_SEARCH_PATIENTS, (f"{q}%", int(limit)))
+
+    return [
+        {"patient_ref": r[0], "demographics": _loads(r[1]) if r[1] is not None else {}}
+        for r in rows
+    ]
+
+
+_SQL_UPSERT_VISIT = """
+    INSERT INTO visits(
+      visit_ref,
+      patient_ref,
+      occurred_at,
+      primary_domain,
+      intents_json,
+      intake_extracted_json
+    )
+    VALUES(?, ?, ?, ?, ?, ?)
+    ON CONFLICT(visit_ref) DO UPDATE SET
+      patient_ref = excluded.patient_ref,
+      occurred_at = excluded.occurred_at,
+      primary_domain = excluded.primary_domain,
+      intents_json = excluded.intents_json,
+      intake_extracted_json = excluded.intake_extracted_json
+"""
 
 
 def upsert_visit(
@@ -485,38 +1056,39 @@ def upsert_visit(
     intents: list[str],
     intake_extracted: dict[str, Any],
 ) -> None:
-    with _connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO visits(
-              visit_ref,
-              patient_ref,
-              occurred_at,
-              primary_domain,
-              intents_json,
-              intake_extracted_json
-            )
-            VALUES(?, ?, ?, ?, ?, ?)
-            ON CONFLICT(visit_ref) DO UPDATE SET
-              patient_ref = excluded.patient_ref,
-              occurred_at = excluded.occurred_at,
-              primary_domain = excluded.primary_domain,
-              intents_json = excluded.intents_json,
-              intake_extracted_json = excluded.intake_extracted_json
-            """,
-            (
-                visit_ref,
-                patient_ref,
-                occurred_at,
-                primary_domain,
-                json.dumps(intents, ensure_ascii=False, separators=(",", ":")),
-                json.dumps(intake_extracted, ensure_ascii=False, separators=(",", ":")),
-            ),
+    upsert_visits(
+        [
+            {
+                "visit_ref": visit_ref,
+                "patient_ref": patient_ref,
+                "occurred_at": occurred_at,
+                "primary_domain": primary_domain,
+                "intents": intents,
+                "intake_extracted": intake_extracted,
+            }
+        ]
+    )
+
+
+def upsert_visits(visits: list[dict[str, Any]]) -> None:
+    """Upsert several visits (dicts of `upsert_visit` arguments) in one transaction."""
+    rows = [
+        (
+            v["visit_ref"],
+            v["patient_ref"],
+            v["occurred_at"],
+            v["primary_domain"],
+            _dumps(v["intents"]),
+            _dumps(v["intake_extracted"]),
         )
+        for v in visits
+    ]
+    with _get_conn() as conn:
+        conn.executemany(_SQL_UPSERT_VISIT, rows)
 
 
 def get_visit(visit_ref: str) -> dict[str, Any] | None:
-    with _connect() as conn:
+    with _read_conn() as conn:
         row = conn.execute(
             """
             SELECT
@@ -538,103 +1110,125 @@ def get_visit(visit_ref: str) -> dict[str, Any] | None:
             "patient_ref": row["patient_ref"],
             "occurred_at": row["occurred_at"],
             "primary_domain": row["primary_domain"],
-            "intents": json.loads(row["intents_json"]),
-            "intake_extracted": json.loads(row["intake_extracted_json"]),
+            "intents": _loads(row["intents_json"]),
+            "intake_extracted": _loads(row["intake_extracted_json"]),
         }
 
 
 def list_patient_visits(*, patient_ref: str, limit: int = 50) -> list[dict[str, Any]]:
-    with _connect() as conn:
-        rows = conn.execute(
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(
+            conn,
             """
             SELECT
               visit_ref,
-              patient_ref,
               occurred_at,
               primary_domain,
               intents_json,
-              intake_extracted_json
+              json_extract(intake_extracted_json, '$.presenting_problem')
             FROM visits
             WHERE patient_ref = ?
             ORDER BY occurred_at DESC, visit_ref DESC
             LIMIT ?
             """,
             (patient_ref, int(limit)),
-        ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        intake = json.loads(row["intake_extracted_json"])
-        presenting = intake.get("presenting_problem") if isinstance(intake, dict) else None
-        out.append(
-            {
-                "visit_ref": row["visit_ref"],
-                "occurred_at": row["occurred_at"],
-                "primary_domain": row["primary_domain"],
-                "intents": json.loads(row["intents_json"]),
-                "presenting_problem": presenting if isinstance(presenting, str) else "",
-            }
         )
-    return out
 
+    return [_visit_list_item_from_row(row) for row in rows]
 
-def upsert_pharmacy_event(
-    *,
-    event_ref: str,
+
+def _visit_list_item_from_row(row: tuple[Any, ...]) -> dict[str, Any]:
+    # presenting_problem is projected in SQL (only that string crosses into Python);
+    # intake_extracted is schema-validated before every upsert_visit(s).
+    return {
+        "visit_ref": row[0],
+        "occurred_at": row[1],
+        "primary_domain": row[2],
+        "intents": _loads(row[3]),
+        "presenting_problem": row[4],
+    }
+
+
+_SQL_UPSERT_PHARMACY_EVENT = """
+    INSERT INTO events(
+      event_ref,
+      visit_ref,
+      patient_ref,
+      occurred_at,
+      event_type,
+      payload_json
+    )
+    VALUES(?, ?, ?, ?, ?, ?)
+    ON CONFLICT(event_ref) DO UPDATE SET
+      visit_ref = excluded.visit_ref,
+      patient_ref = excluded.patient_ref,
+      occurred_at = excluded.occurred_at,
+      event_type = excluded.event_type,
+      payload_json = excluded.payload_json
+"""
+
+
+def upsert_pharmacy_event(
+    *,
+    event_ref: str,
     visit_ref: str,
     patient_ref: str,
     occurred_at: str,
     event_type: str,
     payload: dict[str, Any],
 ) -> None:
-    with _connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO events(
-              event_ref,
-              visit_ref,
-              patient_ref,
-              occurred_at,
-              event_type,
-              payload_json
-            )
-            VALUES(?, ?, ?, ?, ?, ?)
-            ON CONFLICT(event_ref) DO UPDATE SET
-              visit_ref = excluded.visit_ref,
-              patient_ref = excluded.patient_ref,
-              occurred_at = excluded.occurred_at,
-              event_type = excluded.event_type,
-              payload_json = excluded.payload_json
-            """,
-            (
-                event_ref,
-                visit_ref,
-                patient_ref,
-                occurred_at,
-                event_type,
-                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
-            ),
+    upsert_pharmacy_events(
+        [
+            {
+                "event_ref": event_ref,
+                "visit_ref": visit_ref,
+                "patient_ref": patient_ref,
+                "occurred_at": occurred_at,
+                "event_type": event_type,
+                "payload": payload,
+            }
+        ]
+    )
+
+
+def upsert_pharmacy_events(events: list[dict[str, Any]]) -> None:
+    """Upsert several events (dicts of `upsert_pharmacy_event` arguments) in one transaction."""
+    rows = [
+        (
+            e["event_ref"],
+            e["visit_ref"],
+            e["patient_ref"],
+            e["occurred_at"],
+            e["event_type"],
+            _dumps(e["payload"]),
         )
+        for e in events
+    ]
+    with _get_conn() as conn:
+        conn.executemany(_SQL_UPSERT_PHARMACY_EVENT, rows)
+
+
+_SQL_UPSERT_INVENTORY_PRODUCT = """
+    INSERT INTO inventory(sku, product_json)
+    VALUES(?, ?)
+    ON CONFLICT(sku) DO UPDATE SET
+      product_json = excluded.product_json
+"""
 
 
 def upsert_inventory_product(*, sku: str, product: dict[str, Any]) -> None:
-    with _connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO inventory(sku, product_json)
-            VALUES(?, ?)
-            ON CONFLICT(sku) DO UPDATE SET
-              product_json = excluded.product_json
-            """,
-            (
-                sku,
-                json.dumps(product, ensure_ascii=False, separators=(",", ":")),
-            ),
-        )
+    upsert_inventory_products([(sku, product)])
+
+
+def upsert_inventory_products(products: list[tuple[str, dict[str, Any]]]) -> None:
+    """Upsert several `(sku, product)` rows in one transaction."""
+    rows = [(sku, _dumps(product)) for sku, product in products]
+    with _get_conn() as conn:
+        conn.executemany(_SQL_UPSERT_INVENTORY_PRODUCT, rows)
 
 
 def upsert_document(*, doc_ref: str, metadata: dict[str, Any]) -> None:
-    with _connect() as conn:
+    with _get_conn() as conn:
         conn.execute(
             """
             INSERT INTO documents(doc_ref, metadata_json)
@@ -644,13 +1238,13 @@ def upsert_document(*, doc_ref: str, metadata: dict[str, Any]) -> None:
             """,
             (
                 doc_ref,
-                json.dumps(metadata, ensure_ascii=False, separators=(",", ":")),
+                _dumps(metadata),
             ),
         )
 
 
 def get_document(doc_ref: str) -> dict[str, Any] | None:
-    with _connect() as conn:
+    with _read_conn() as conn:
         row = conn.execute(
             "SELECT doc_ref, metadata_json FROM documents WHERE doc_ref = ?",
             (doc_ref,),
@@ -659,10 +1253,45 @@ def get_document(doc_ref: str) -> dict[str, Any] | None:
         return None
     return {
         "doc_ref": row["doc_ref"],
-        "metadata": _json_load_object(row["metadata_json"]),
+        "metadata": _loads(row["metadata_json"]),
     }
 
 
+def _analysis_state_upsert_sql(optional_columns: tuple[str, ...]) -> str:
+    updates = ["status = excluded.status", "updated_at = excluded.updated_at"]
+    updates.extend(f"{col} = excluded.{col}" for col in optional_columns)
+    return f"""
+        INSERT INTO patient_analysis_state(
+          patient_ref,
+          status,
+          updated_at,
+          last_run_id,
+          last_error,
+          changed_since_last_analysis,
+          refresh_reason
+        )
+        VALUES(?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(patient_ref) DO UPDATE SET
+          {", ".join(updates)}
+    """
+
+
+_ANALYSIS_STATE_OPTIONAL_COLUMNS = (
+    "last_run_id",
+    "last_error",
+    "changed_since_last_analysis",
+    "refresh_reason",
+)
+# All 16 upsert shapes, keyed by which optional columns are provided. Built once so
+# each call reuses the same SQL text (and sqlite3's prepared-statement cache).
+_SQL_UPSERT_ANALYSIS_STATE: dict[tuple[bool, bool, bool, bool], str] = {
+    key: _analysis_state_upsert_sql(
+        tuple(col for col, on in zip(_ANALYSIS_STATE_OPTIONAL_COLUMNS, key, strict=True) if on)
+    )
+    for key in itertools.product((False, True), repeat=4)
+}
+
+
 def set_patient_analysis_state(
     *,
     patient_ref: str,
@@ -672,32 +1301,17 @@ def set_patient_analysis_state(
     changed_since_last_analysis: bool | None = None,
     refresh_reason: str | None = None,
 ) -> None:
-    updates: list[str] = ["status = excluded.status", "updated_at = excluded.updated_at"]
-    if last_run_id is not None:
-        updates.append("last_run_id = excluded.last_run_id")
-    if last_error is not None:
-        updates.append("last_error = excluded.last_error")
-    if changed_since_last_analysis is not None:
-        updates.append("changed_since_last_analysis = excluded.changed_since_last_analysis")
-    if refresh_reason is not None:
-        updates.append("refresh_reason = excluded.refresh_reason")
-
-    with _connect() as conn:
+    sql = _SQL_UPSERT_ANALYSIS_STATE[
+        (
+            last_run_id is not None,
+            last_error is not None,
+            changed_since_last_analysis is not None,
+            refresh_reason is not None,
+        )
+    ]
+    with _get_conn() as conn:
         conn.execute(
-            f"""
-            INSERT INTO patient_analysis_state(
-              patient_ref,
-              status,
-              updated_at,
-              last_run_id,
-              last_error,
-              changed_since_last_analysis,
-              refresh_reason
-            )
-            VALUES(?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(patient_ref) DO UPDATE SET
-              {", ".join(updates)}
-            """,
+            sql,
             (
                 patient_ref,
                 status,
@@ -711,8 +1325,9 @@ def set_patient_analysis_state(
 
 
 def get_patient_analysis_state(patient_ref: str) -> dict[str, Any] | None:
-    with _connect() as conn:
-        row = conn.execute(
+    with _read_conn() as conn:
+        row = _iter_tuples(
+            conn,
             """
             SELECT
               patient_ref,
@@ -729,17 +1344,52 @@ def get_patient_analysis_state(patient_ref: str) -> dict[str, Any] | None:
         ).fetchone()
     if not row:
         return None
+    return _analysis_state_from_row(row)
+
+
+def get_patient_analysis_states(*, patient_refs: list[str]) -> dict[str, dict[str, Any]]:
+    """Batch variant of `get_patient_analysis_state`, keyed by patient_ref."""
+    if not patient_refs:
+        return {}
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(
+            conn,
+            """
+            SELECT
+              patient_ref,
+              status,
+              updated_at,
+              last_run_id,
+              last_error,
+              changed_since_last_analysis,
+              refresh_reason
+            FROM patient_analysis_state
+            WHERE patient_ref IN (SELECT value FROM json_each(?))
+            """,
+            (_json_refs(patient_refs),),
+        )
+    return {str(row[0]): _analysis_state_from_row(row) for row in rows}
+
+
+def _analysis_state_from_row(row: tuple[Any, ...]) -> dict[str, Any]:
+    # Column order of the patient_analysis_state SELECTs above.
     return {
-        "patient_ref": row["patient_ref"],
-        "status": row["status"],
-        "updated_at": row["updated_at"],
-        "last_run_id": row["last_run_id"],
-        "last_error": row["last_error"],
-        "changed_since_last_analysis": bool(int(row["changed_since_last_analysis"] or 0)),
-        "refresh_reason": row["refresh_reason"],
+        "patient_ref": row[0],
+        "status": row[1],
+        "updated_at": row[2],
+        "last_run_id": row[3],
+        "last_error": row[4],
+        "changed_since_last_analysis": bool(int(row[5] or 0)),
+        "refresh_reason": row[6],
     }
 
 
+def _json_refs(refs: list[str]) -> str:
+    # A single JSON array parameter (expanded with json_each) avoids SQLite's
+    # host-parameter limit on large IN (...) lists.
+    return _dumps(list(refs))
+
+
 def list_inventory(*, limit: int | None = None) -> list[dict[str, Any]]:
     sql = "SELECT product_json FROM inventory ORDER BY sku ASC"
     params: tuple[Any, ...] = ()
@@ -747,63 +1397,57 @@ def list_inventory(*, limit: int | None = None) -> list[dict[str, Any]]:
         sql += " LIMIT ?"
         params = (limit,)
 
-    with _connect() as conn:
-        rows = conn.execute(sql, params).fetchall()
-    return [json.loads(r["product_json"]) for r in rows]
+    with _read_conn() as conn:
+        return [_loads(r[0]) for r in _iter_tuples(conn, sql, params)]
+
+
+def _count_rows(table: str) -> int:
+    with _read_conn() as conn:
+        row = conn.execute(
+            "SELECT row_count FROM table_row_counts WHERE table_name = ?", (table,)
+        ).fetchone()
+        if row is None:
+            # Counter not seeded (init_db not run on this DB yet): count directly.
+            row = conn.execute(f"SELECT COUNT(1) AS row_count FROM {table}").fetchone()
+        return int(row["row_count"]) if row else 0
 
 
 def count_patients() -> int:
-    with _connect() as conn:
-        row = conn.execute("SELECT COUNT(1) AS c FROM patients").fetchone()
-        return int(row["c"]) if row else 0
+    return _count_rows("patients")
 
 
 def count_visits() -> int:
-    with _connect() as conn:
-        row = conn.execute("SELECT COUNT(1) AS c FROM visits").fetchone()
-        return int(row["c"]) if row else 0
+    return _count_rows("visits")
 
 
 def count_inventory() -> int:
-    with _connect() as conn:
-        row = conn.execute("SELECT COUNT(1) AS c FROM inventory").fetchone()
-        return int(row["c"]) if row else 0
+    return _count_rows("inventory")
 
 
 def count_documents() -> int:
-    with _connect() as conn:
-        row = conn.execute("SELECT COUNT(1) AS c FROM documents").fetchone()
-        return int(row["c"]) if row else 0
+    return _count_rows("documents")
 
 
 def list_patient_refs_with_visits(*, limit: int | None = 200) -> list[str]:
-    with _connect() as conn:
-        if limit is None:
-            rows = conn.execute(
-                """
-                SELECT patient_ref
-                FROM visits
-                GROUP BY patient_ref
-                ORDER BY MAX(occurred_at) DESC, patient_ref ASC
-                """
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """
-                SELECT patient_ref
-                FROM visits
-                GROUP BY patient_ref
-                ORDER BY MAX(occurred_at) DESC, patient_ref ASC
-                LIMIT ?
-                """,
-                (int(limit),),
-            ).fetchall()
-    return [str(r["patient_ref"]) for r in rows if isinstance(r["patient_ref"], str)]
+    sql = """
+        SELECT patient_ref
+        FROM patient_latest_visit
+        ORDER BY occurred_at DESC, patient_ref ASC
+    """
+    params: tuple[Any, ...] = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (int(limit),)
+
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(conn, sql, params)
+    return [r[0] for r in rows if isinstance(r[0], str)]
 
 
 def get_latest_patient_visit(*, patient_ref: str) -> dict[str, Any] | None:
-    with _connect() as conn:
-        row = conn.execute(
+    with _read_conn() as conn:
+        row = _iter_tuples(
+            conn,
             """
             SELECT visit_ref, occurred_at, primary_domain
             FROM visits
@@ -815,11 +1459,41 @@ def get_latest_patient_visit(*, patient_ref: str) -> dict[str, Any] | None:
         ).fetchone()
     if not row:
         return None
-    return {
-        "visit_ref": row["visit_ref"],
-        "occurred_at": row["occurred_at"],
-        "primary_domain": row["primary_domain"],
-    }
+    return _visit_summary_from_row(row)
+
+
+def get_latest_visits_for_patients(*, patient_refs: list[str]) -> dict[str, dict[str, Any]]:
+    """Batch variant of `get_latest_patient_visit`, keyed by patient_ref."""
+    if not patient_refs:
+        return {}
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(
+            conn,
+            """
+            SELECT visit_ref, occurred_at, primary_domain, patient_ref
+            FROM (
+              SELECT
+                patient_ref,
+                visit_ref,
+                occurred_at,
+                primary_domain,
+                ROW_NUMBER() OVER (
+                  PARTITION BY patient_ref
+                  ORDER BY occurred_at DESC, visit_ref DESC
+                ) AS rn
+              FROM visits
+              WHERE patient_ref IN (SELECT value FROM json_each(?))
+            )
+            WHERE rn = 1
+            """,
+            (_json_refs(patient_refs),),
+        )
+    return {str(row[-1]): _visit_summary_from_row(row) for row in rows}
+
+
+def _visit_summary_from_row(row: tuple[Any, ...]) -> dict[str, Any]:
+    # (visit_ref, occurred_at, primary_domain[, patient_ref]) positional row.
+    return {"visit_ref": row[0], "occurred_at": row[1], "primary_domain": row[2]}
 
 
 def get_latest_run_for_patient(
@@ -828,18 +1502,19 @@ def get_latest_run_for_patient(
     trigger: str | None = None,
     status: str | None = None,
 ) -> dict[str, Any] | None:
-    conditions = ["json_extract(input_json, '$.patient_ref') = ?"]
+    conditions = ["patient_ref = ?"]
     params: list[Any] = [patient_ref]
     if isinstance(trigger, str) and trigger.strip():
-        conditions.append("json_extract(input_json, '$.trigger') = ?")
+        conditions.append("run_trigger = ?")
         params.append(trigger.strip())
     if isinstance(status, str) and status.strip():
         conditions.append("status = ?")
         params.append(status.strip())
 
     where = " AND ".join(conditions)
-    with _connect() as conn:
-        row = conn.execute(
+    with _read_conn() as conn:
+        row = _iter_tuples(
+            conn,
             f"""
             SELECT run_id, created_at, status, input_json
             FROM runs
@@ -851,18 +1526,79 @@ def get_latest_run_for_patient(
         ).fetchone()
     if not row:
         return None
-    input_payload = _json_load_object(row["input_json"])
-    visit_ref = input_payload.get("visit_ref")
-    language = input_payload.get("language")
+    return _run_summary_from_row(row)
+
+
+def get_latest_runs_for_patients(
+    *,
+    patient_refs: list[str],
+    trigger: str | None = None,
+    status: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Batch variant of `get_latest_run_for_patient`, keyed by patient_ref."""
+    if not patient_refs:
+        return {}
+    conditions = ["patient_ref IN (SELECT value FROM json_each(?))"]
+    params: list[Any] = [_json_refs(patient_refs)]
+    if isinstance(trigger, str) and trigger.strip():
+        conditions.append("run_trigger = ?")
+        params.append(trigger.strip())
+    if isinstance(status, str) and status.strip():
+        conditions.append("status = ?")
+        params.append(status.strip())
+
+    where = " AND ".join(conditions)
+    with _read_conn() as conn:
+        rows = _fetchall_tuples(
+            conn,
+            f"""
+            SELECT run_id, created_at, status, input_json, patient_ref
+            FROM (
+              SELECT
+                patient_ref,
+                run_id,
+                created_at,
+                status,
+                input_json,
+                ROW_NUMBER() OVER (
+                  PARTITION BY patient_ref
+                  ORDER BY created_at DESC, run_id DESC
+                ) AS rn
+              FROM runs
+              WHERE {where}
+            )
+            WHERE rn = 1
+            """,
+            params,
+        )
+    return {str(row[-1]): _run_summary_from_row(row) for row in rows}
+
+
+def _run_summary_from_row(row: tuple[Any, ...]) -> dict[str, Any]:
+    # (run_id, created_at, status, input_json[, patient_ref]) positional row.
+    visit_ref, language = _run_input_refs(row[3])
     return {
-        "run_id": row["run_id"],
-        "created_at": row["created_at"],
-        "status": row["status"],
-        "visit_ref": visit_ref if isinstance(visit_ref, str) else None,
-        "language": language if isinstance(language, str) else None,
+        "run_id": row[0],
+        "created_at": row[1],
+        "status": row[2],
+        "visit_ref": visit_ref,
+        "language": language,
     }
 
 
+@functools.lru_cache(maxsize=4096)
+def _run_input_refs(raw: str) -> tuple[str | None, str | None]:
+    """(visit_ref, language) of a run's input_json, memoized by content.
+
+    input_json is written once by `create_run` and never updated, and inbox refreshes
+    re-read the same latest runs over and over. The cached value is an immutable tuple,
+    so callers never share a mutable parsed dict.
+    """
+    # Runs are schema-validated before create_run, so these are strings when present.
+    input_payload = _loads(raw)
+    return input_payload.get("visit_ref"), input_payload.get("language")
+
+
 _DB_PREVIEW_TABLES = (
     "runs",
     "run_events",
@@ -876,22 +1612,6 @@ _DB_PREVIEW_TABLES = (
 _DB_PREVIEW_LIMIT_MAX = 100
 
 
-def _json_load_object(raw: str) -> dict[str, Any]:
-    try:
-        value = json.loads(raw)
-    except Exception:
-        return {}
-    return value if isinstance(value, dict) else {}
-
-
-def _json_load_list(raw: str) -> list[Any]:
-    try:
-        value = json.loads(raw)
-    except Exception:
-        return []
-    return value if isinstance(value, list) else []
-
-
 def list_db_preview_tables() -> list[str]:
     return list(_DB_PREVIEW_TABLES)
 
@@ -904,23 +1624,9 @@ def preview_db_table(*, table: str, query: str = "", limit: int = 50) -> dict[st
     query_norm = (query or "").strip()
     limit_norm = max(1, min(int(limit), _DB_PREVIEW_LIMIT_MAX))
 
-    with _connect() as conn:
-        if table_norm == "runs":
-            columns, rows, count = _preview_runs(conn, query_norm, limit_norm)
-        elif table_norm == "run_events":
-            columns, rows, count = _preview_run_events(conn, query_norm, limit_norm)
-        elif table_norm == "patients":
-            columns, rows, count = _preview_patients(conn, query_norm, limit_norm)
-        elif table_norm == "visits":
-            columns, rows, count = _preview_visits(conn, query_norm, limit_norm)
-        elif table_norm == "events":
-            columns, rows, count = _preview_events(conn, query_norm, limit_norm)
-        elif table_norm == "inventory":
-            columns, rows, count = _preview_inventory(conn, query_norm, limit_norm)
-        elif table_norm == "patient_analysis_state":
-            columns, rows, count = _preview_patient_analysis_state(conn, query_norm, limit_norm)
-        else:
-            columns, rows, count = _preview_documents(conn, query_norm, limit_norm)
+    preview = _PREVIEW_DISPATCH[table_norm]
+    with _read_conn() as conn:
+        columns, rows, count = preview(conn, query_norm, limit_norm)
 
     return {
         "schema_version": "0.0.0",
@@ -934,430 +1640,454 @@ def preview_db_table(*, table: str, query: str = "", limit: int = 50) -> dict[st
     }
 
 
+# Preview projections run in SQLite (JSON1) so only the displayed scalars cross into
+# Python. They rely on write-time guarantees instead of re-checking shapes per row:
+# every JSON column is written by `_dumps`, and callers schema-validate patients,
+# visits, products and runs before storing them.
+
+
+def _json_array_length_sql(column: str, path: str) -> str:
+    """SQL for `len(value)` if the JSON value at `path` is an array, else 0."""
+    # json_array_length is 0 for non-arrays and NULL for a missing path.
+    return f"ifnull(json_array_length({column}, '{path}'), 0)"
+
+
+def _json_top_keys_sql(column: str) -> str:
+    """SQL for the first 20 sorted top-level keys of a JSON object, as a JSON array.
+
+    No DISTINCT: stored documents are written by `_dumps` from dicts, so keys are
+    unique, and ORDER BY + LIMIT then keeps only the 20 smallest keys while sorting
+    (a bounded top-N, rather than a temp b-tree over every key first).
+    """
+    return f"""(
+          SELECT json_group_array(key) FROM (
+            SELECT key FROM json_each({column})
+            ORDER BY key
+            LIMIT 20
+          )
+        )"""
+
+
+# Preview statements, built once at import and keyed by (table, has_query), so each
+# call reuses the identical SQL text (and its prepared statement in the connection's
+# statement cache) instead of re-formatting it.
+_SQL_PREVIEW: dict[tuple[str, bool], str] = {}
+
+
+def _register_preview_sql(table: str, *, select: str, query_where: str, order_by: str) -> None:
+    """Build the page+count statement for `table`, with and without `query_where`.
+
+    The page is picked by rowid with `COUNT(*) OVER ()` (computed before LIMIT), so only
+    the sort keys of non-matching rows are visited; full rows (and their JSON) are read
+    for the page only.
+
+    `select` reads JSON columns without per-row guards, relying on write-time validation:
+    missing fields come back as None, and a malformed JSON value makes the JSON
+    functions raise, failing the whole preview rather than skipping the row.
+    """
+    for has_query, where in ((False, ""), (True, query_where)):
+        _SQL_PREVIEW[(table, has_query)] = f"""
+        SELECT {select}, page.total
+        FROM (
+          SELECT rowid AS rid, COUNT(*) OVER () AS total
+          FROM {table}
+          {where}
+          ORDER BY {order_by}
+          LIMIT ?
+        ) AS page
+        JOIN {table} ON {table}.rowid = page.rid
+        ORDER BY {order_by}
+        """
+
+
+def _preview_page(
+    conn: sqlite3.Connection, table: str, params: tuple[Any, ...], limit: int
+) -> tuple[Iterator[tuple[Any, ...]], int]:
+    """Run one preview page + total count statement; rows stream off the cursor.
+
+    `params` are the `query_where` parameters (empty when there is no query). The
+    total is read from the first row, so the rows are never all held at once.
+    """
+    sql = _SQL_PREVIEW[(table, bool(params))]
+    cur = _iter_tuples(conn, sql, (*params, int(limit)))
+    first = cur.fetchone()
+    if first is None:
+        # limit >= 1, so an empty page means nothing matched.
+        return iter(()), 0
+    return itertools.chain((first,), cur), int(first[-1])
+
+
+_RUNS_PREVIEW_COLUMNS = (
+    "run_id",
+    "created_at",
+    "status",
+    "language",
+    "case_ref",
+    "patient_ref",
+    "visit_ref",
+    "follow_up_questions_count",
+    "has_report",
+    "has_handout",
+    "has_trace",
+    "policy_violations_count",
+)
+
+_register_preview_sql(
+    "runs",
+    select=f"""
+      run_id,
+      created_at,
+      status,
+      json_extract(input_json, '$.language'),
+      json_extract(input_json, '$.case_ref'),
+      json_extract(input_json, '$.patient_ref'),
+      json_extract(input_json, '$.visit_ref'),
+      {_json_array_length_sql("artifacts_json", "$.recommendation.follow_up_questions")},
+      json_type(artifacts_json, '$.report_markdown') IS 'text',
+      json_type(artifacts_json, '$.handout_markdown') IS 'text',
+      json_type(artifacts_json, '$.trace') IS 'object',
+      {_json_array_length_sql("policy_violations_json", "$")}
+    """,
+    query_where="WHERE run_id LIKE ?",
+    order_by="created_at DESC, run_id DESC",
+)
+
+
 def _preview_runs(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE run_id LIKE ?"
-        params = (f"{query}%",)
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM runs {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT run_id, created_at, status, input_json, artifacts_json, policy_violations_json
-        FROM runs
-        {where}
-        ORDER BY created_at DESC, run_id DESC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        input_obj = _json_load_object(row["input_json"])
-        artifacts_obj = _json_load_object(row["artifacts_json"])
-        policy_violations = _json_load_list(row["policy_violations_json"])
-        recommendation = artifacts_obj.get("recommendation")
-        follow_up_questions = (
-            recommendation.get("follow_up_questions")
-            if isinstance(recommendation, dict)
-            else []
-        )
-        out.append(
-            {
-                "run_id": row["run_id"],
-                "created_at": row["created_at"],
-                "status": row["status"],
-                "language": str(input_obj.get("language") or ""),
-                "case_ref": str(input_obj.get("case_ref") or ""),
-                "patient_ref": str(input_obj.get("patient_ref") or ""),
-                "visit_ref": str(input_obj.get("visit_ref") or ""),
-                "follow_up_questions_count": len(follow_up_questions)
-                if isinstance(follow_up_questions, list)
-                else 0,
-                "has_report": isinstance(artifacts_obj.get("report_markdown"), str),
-                "has_handout": isinstance(artifacts_obj.get("handout_markdown"), str),
-                "has_trace": isinstance(artifacts_obj.get("trace"), dict),
-                "policy_violations_count": len(policy_violations),
-            }
-        )
+    params = (f"{query}%",) if query else ()
+    rows, count = _preview_page(conn, "runs", params, limit)
+
+    out = [
+        {
+            "run_id": row[0],
+            "created_at": row[1],
+            "status": row[2],
+            "language": str(row[3] or ""),
+            "case_ref": str(row[4] or ""),
+            "patient_ref": str(row[5] or ""),
+            "visit_ref": str(row[6] or ""),
+            "follow_up_questions_count": row[7],
+            "has_report": bool(row[8]),
+            "has_handout": bool(row[9]),
+            "has_trace": bool(row[10]),
+            "policy_violations_count": row[11],
+        }
+        for row in rows
+    ]
+
+    return list(_RUNS_PREVIEW_COLUMNS), out, count
+
+
+_RUN_EVENTS_PREVIEW_COLUMNS = (
+    "id",
+    "run_id",
+    "ts",
+    "type",
+    "step",
+    "message",
+    "tool_name",
+    "result_summary",
+    "rule_id",
+    "severity",
+)
 
-    return (
-        [
-            "run_id",
-            "created_at",
-            "status",
-            "language",
-            "case_ref",
-            "patient_ref",
-            "visit_ref",
-            "follow_up_questions_count",
-            "has_report",
-            "has_handout",
-            "has_trace",
-            "policy_violations_count",
-        ],
-        out,
-        int(count["c"]) if count else 0,
-    )
+_register_preview_sql(
+    "run_events",
+    select="""
+      id,
+      run_id,
+      ts,
+      type,
+      json_extract(data_json, '$.step'),
+      json_extract(data_json, '$.message'),
+      json_extract(data_json, '$.tool_name'),
+      json_extract(data_json, '$.result_summary'),
+      json_extract(data_json, '$.rule_id'),
+      json_extract(data_json, '$.severity')
+    """,
+    query_where="WHERE run_id LIKE ? OR type LIKE ?",
+    order_by="id DESC",
+)
 
 
 def _preview_run_events(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE run_id LIKE ? OR type LIKE ?"
-        params = (f"{query}%", f"{query}%")
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM run_events {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT id, run_id, ts, type, data_json
-        FROM run_events
-        {where}
-        ORDER BY id DESC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        data = _json_load_object(row["data_json"])
-        out.append(
-            {
-                "id": int(row["id"]),
-                "run_id": row["run_id"],
-                "ts": row["ts"],
-                "type": row["type"],
-                "step": str(data.get("step") or ""),
-                "message": str(data.get("message") or ""),
-                "tool_name": str(data.get("tool_name") or ""),
-                "result_summary": str(data.get("result_summary") or ""),
-                "rule_id": str(data.get("rule_id") or ""),
-                "severity": str(data.get("severity") or ""),
-            }
-        )
+    params = (f"{query}%", f"{query}%") if query else ()
+    rows, count = _preview_page(conn, "run_events", params, limit)
+
+    out = [
+        {
+            "id": int(row[0]),
+            "run_id": row[1],
+            "ts": row[2],
+            "type": row[3],
+            "step": str(row[4] or ""),
+            "message": str(row[5] or ""),
+            "tool_name": str(row[6] or ""),
+            "result_summary": str(row[7] or ""),
+            "rule_id": str(row[8] or ""),
+            "severity": str(row[9] or ""),
+        }
+        for row in rows
+    ]
 
-    return (
-        [
-            "id",
-            "run_id",
-            "ts",
-            "type",
-            "step",
-            "message",
-            "tool_name",
-            "result_summary",
-            "rule_id",
-            "severity",
-        ],
-        out,
-        int(count["c"]) if count else 0,
-    )
+    return list(_RUN_EVENTS_PREVIEW_COLUMNS), out, count
+
+
+_PATIENTS_PREVIEW_COLUMNS = (
+    "patient_ref",
+    "age_years",
+    "sex",
+    "allergies_count",
+    "conditions_count",
+    "current_medications_count",
+)
+
+_register_preview_sql(
+    "patients",
+    select=f"""
+      patient_ref,
+      json_extract(llm_context_json, '$.demographics.age_years'),
+      json_extract(llm_context_json, '$.demographics.sex'),
+      {_json_array_length_sql("llm_context_json", "$.allergies")},
+      {_json_array_length_sql("llm_context_json", "$.conditions")},
+      {_json_array_length_sql("llm_context_json", "$.current_medications")}
+    """,
+    query_where="WHERE patient_ref LIKE ?",
+    order_by="patient_ref ASC",
+)
 
 
 def _preview_patients(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE patient_ref LIKE ?"
-        params = (f"{query}%",)
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM patients {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT patient_ref, llm_context_json
-        FROM patients
-        {where}
-        ORDER BY patient_ref ASC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        llm_context = _json_load_object(row["llm_context_json"])
-        demo = llm_context.get("demographics") if isinstance(llm_context, dict) else {}
-        allergies = llm_context.get("allergies") if isinstance(llm_context, dict) else []
-        conditions = llm_context.get("conditions") if isinstance(llm_context, dict) else []
-        current_meds = (
-            llm_context.get("current_medications") if isinstance(llm_context, dict) else []
-        )
-        out.append(
-            {
-                "patient_ref": row["patient_ref"],
-                "age_years": int(demo.get("age_years"))
-                if isinstance(demo, dict) and isinstance(demo.get("age_years"), int)
-                else None,
-                "sex": str(demo.get("sex") or "") if isinstance(demo, dict) else "",
-                "allergies_count": len(allergies) if isinstance(allergies, list) else 0,
-                "conditions_count": len(conditions) if isinstance(conditions, list) else 0,
-                "current_medications_count": len(current_meds)
-                if isinstance(current_meds, list)
-                else 0,
-            }
-        )
+    params = (f"{query}%",) if query else ()
+    rows, count = _preview_page(conn, "patients", params, limit)
+
+    out = [
+        {
+            "patient_ref": row[0],
+            "age_years": row[1],
+            "sex": row[2],
+            "allergies_count": row[3],
+            "conditions_count": row[4],
+            "current_medications_count": row[5],
+        }
+        for row in rows
+    ]
+
+    return list(_PATIENTS_PREVIEW_COLUMNS), out, count
 
-    return (
-        [
-            "patient_ref",
-            "age_years",
-            "sex",
-            "allergies_count",
-            "conditions_count",
-            "current_medications_count",
-        ],
-        out,
-        int(count["c"]) if count else 0,
-    )
+
+_VISITS_PREVIEW_COLUMNS = (
+    "visit_ref",
+    "patient_ref",
+    "occurred_at",
+    "primary_domain",
+    "intents_count",
+    "presenting_problem",
+)
+
+_register_preview_sql(
+    "visits",
+    select=f"""
+      visit_ref,
+      patient_ref,
+      occurred_at,
+      primary_domain,
+      {_json_array_length_sql("intents_json", "$")},
+      json_extract(intake_extracted_json, '$.presenting_problem')
+    """,
+    query_where="WHERE visit_ref LIKE ? OR patient_ref LIKE ?",
+    order_by="occurred_at DESC, visit_ref DESC",
+)
 
 
 def _preview_visits(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE visit_ref LIKE ? OR patient_ref LIKE ?"
-        params = (f"{query}%", f"{query}%")
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM visits {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT
-            visit_ref,
-            patient_ref,
-            occurred_at,
-            primary_domain,
-            intents_json,
-            intake_extracted_json
-        FROM visits
-        {where}
-        ORDER BY occurred_at DESC, visit_ref DESC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        intents = _json_load_list(row["intents_json"])
-        intake = _json_load_object(row["intake_extracted_json"])
-        presenting_problem = intake.get("presenting_problem")
-        out.append(
-            {
-                "visit_ref": row["visit_ref"],
-                "patient_ref": row["patient_ref"],
-                "occurred_at": row["occurred_at"],
-                "primary_domain": row["primary_domain"] or "",
-                "intents_count": len(intents),
-                "presenting_problem": presenting_problem
-                if isinstance(presenting_problem, str)
-                else "",
-            }
-        )
+    params = (f"{query}%", f"{query}%") if query else ()
+    rows, count = _preview_page(conn, "visits", params, limit)
+
+    out = [
+        {
+            "visit_ref": row[0],
+            "patient_ref": row[1],
+            "occurred_at": row[2],
+            "primary_domain": row[3] or "",
+            "intents_count": row[4],
+            "presenting_problem": row[5],
+        }
+        for row in rows
+    ]
 
-    return (
-        [
-            "visit_ref",
-            "patient_ref",
-            "occurred_at",
-            "primary_domain",
-            "intents_count",
-            "presenting_problem",
-        ],
-        out,
-        int(count["c"]) if count else 0,
-    )
+    return list(_VISITS_PREVIEW_COLUMNS), out, count
+
+
+_EVENTS_PREVIEW_COLUMNS = (
+    "event_ref",
+    "visit_ref",
+    "patient_ref",
+    "occurred_at",
+    "event_type",
+    "payload_keys",
+)
+
+_register_preview_sql(
+    "events",
+    select=f"""
+      event_ref,
+      visit_ref,
+      patient_ref,
+      occurred_at,
+      event_type,
+      {_json_top_keys_sql("payload_json")}
+    """,
+    query_where=(
+        "WHERE event_ref LIKE ? OR visit_ref LIKE ? OR "
+        "patient_ref LIKE ? OR event_type LIKE ?"
+    ),
+    order_by="occurred_at DESC, event_ref DESC",
+)
 
 
 def _preview_events(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = (
-            "WHERE event_ref LIKE ? OR visit_ref LIKE ? OR "
-            "patient_ref LIKE ? OR event_type LIKE ?"
-        )
-        params = (f"{query}%", f"{query}%", f"{query}%", f"{query}%")
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM events {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT event_ref, visit_ref, patient_ref, occurred_at, event_type, payload_json
-        FROM events
-        {where}
-        ORDER BY occurred_at DESC, event_ref DESC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        payload = _json_load_object(row["payload_json"])
-        payload_keys = sorted([k for k in payload.keys() if isinstance(k, str)])[:20]
-        out.append(
-            {
-                "event_ref": row["event_ref"],
-                "visit_ref": row["visit_ref"],
-                "patient_ref": row["patient_ref"],
-                "occurred_at": row["occurred_at"],
-                "event_type": row["event_type"],
-                "payload_keys": payload_keys,
-            }
-        )
+    params = (f"{query}%", f"{query}%", f"{query}%", f"{query}%") if query else ()
+    rows, count = _preview_page(conn, "events", params, limit)
+
+    out = [
+        {
+            "event_ref": row[0],
+            "visit_ref": row[1],
+            "patient_ref": row[2],
+            "occurred_at": row[3],
+            "event_type": row[4],
+            "payload_keys": _loads(row[5]),
+        }
+        for row in rows
+    ]
 
-    return (
-        ["event_ref", "visit_ref", "patient_ref", "occurred_at", "event_type", "payload_keys"],
-        out,
-        int(count["c"]) if count else 0,
-    )
+    return list(_EVENTS_PREVIEW_COLUMNS), out, count
+
+
+_INVENTORY_PREVIEW_COLUMNS = ("sku", "name", "category", "in_stock", "stock_qty", "price_eur")
+
+_register_preview_sql(
+    "inventory",
+    select="""
+      sku,
+      json_extract(product_json, '$.name'),
+      json_extract(product_json, '$.category'),
+      json_extract(product_json, '$.in_stock'),
+      ifnull(json_extract(product_json, '$.stock_qty'), 0),
+      json_extract(product_json, '$.price_eur')
+    """,
+    query_where="WHERE sku LIKE ? OR product_json LIKE ?",
+    order_by="sku ASC",
+)
 
 
 def _preview_inventory(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE sku LIKE ? OR product_json LIKE ?"
-        params = (f"{query}%", f"%{query}%")
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM inventory {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT sku, product_json
-        FROM inventory
-        {where}
-        ORDER BY sku ASC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        product = _json_load_object(row["product_json"])
-        out.append(
-            {
-                "sku": row["sku"],
-                "name": str(product.get("name") or ""),
-                "category": str(product.get("category") or ""),
-                "in_stock": bool(product.get("in_stock")),
-                "stock_qty": int(product.get("stock_qty"))
-                if isinstance(product.get("stock_qty"), int)
-                else 0,
-                "price_eur": float(product.get("price_eur"))
-                if isinstance(product.get("price_eur"), int | float)
-                else None,
-            }
-        )
+    params = (f"{query}%", f"%{query}%") if query else ()
+    rows, count = _preview_page(conn, "inventory", params, limit)
+
+    out = [
+        {
+            "sku": row[0],
+            "name": row[1],
+            "category": row[2],
+            "in_stock": bool(row[3]),
+            "stock_qty": row[4],
+            "price_eur": float(row[5]) if row[5] is not None else None,
+        }
+        for row in rows
+    ]
+
+    return list(_INVENTORY_PREVIEW_COLUMNS), out, count
 
-    return (
-        ["sku", "name", "category", "in_stock", "stock_qty", "price_eur"],
-        out,
-        int(count["c"]) if count else 0,
-    )
+
+_DOCUMENTS_PREVIEW_COLUMNS = ("doc_ref", "metadata_keys")
+
+_register_preview_sql(
+    "documents",
+    select=f"doc_ref, {_json_top_keys_sql('metadata_json')}",
+    query_where="WHERE doc_ref LIKE ?",
+    order_by="doc_ref ASC",
+)
 
 
 def _preview_documents(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE doc_ref LIKE ?"
-        params = (f"{query}%",)
-
-    count = conn.execute(f"SELECT COUNT(1) AS c FROM documents {where}", params).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT doc_ref, metadata_json
-        FROM documents
-        {where}
-        ORDER BY doc_ref ASC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        metadata = _json_load_object(row["metadata_json"])
-        keys = sorted([k for k in metadata.keys() if isinstance(k, str)])[:20]
-        out.append({"doc_ref": row["doc_ref"], "metadata_keys": keys})
+    params = (f"{query}%",) if query else ()
+    rows, count = _preview_page(conn, "documents", params, limit)
 
-    return (
-        ["doc_ref", "metadata_keys"],
-        out,
-        int(count["c"]) if count else 0,
-    )
+    out = [{"doc_ref": row[0], "metadata_keys": _loads(row[1])} for row in rows]
+
+    return list(_DOCUMENTS_PREVIEW_COLUMNS), out, count
+
+
+_PATIENT_ANALYSIS_STATE_PREVIEW_COLUMNS = (
+    "patient_ref",
+    "status",
+    "updated_at",
+    "last_run_id",
+    "changed_since_last_analysis",
+    "refresh_reason",
+)
+
+_register_preview_sql(
+    "patient_analysis_state",
+    select="""
+      patient_ref,
+      status,
+      updated_at,
+      last_run_id,
+      changed_since_last_analysis,
+      refresh_reason
+    """,
+    query_where="WHERE patient_ref LIKE ?",
+    order_by="updated_at DESC, patient_ref ASC",
+)
 
 
 def _preview_patient_analysis_state(
     conn: sqlite3.Connection, query: str, limit: int
 ) -> tuple[list[str], list[dict[str, Any]], int]:
-    where = ""
-    params: tuple[Any, ...] = ()
-    if query:
-        where = "WHERE patient_ref LIKE ?"
-        params = (f"{query}%",)
-
-    count = conn.execute(
-        f"SELECT COUNT(1) AS c FROM patient_analysis_state {where}",
-        params,
-    ).fetchone()
-    rows = conn.execute(
-        f"""
-        SELECT
-          patient_ref,
-          status,
-          updated_at,
-          last_run_id,
-          changed_since_last_analysis,
-          refresh_reason
-        FROM patient_analysis_state
-        {where}
-        ORDER BY updated_at DESC, patient_ref ASC
-        LIMIT ?
-        """,
-        (*params, int(limit)),
-    ).fetchall()
-
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        out.append(
-            {
-                "patient_ref": row["patient_ref"],
-                "status": row["status"],
-                "updated_at": row["updated_at"],
-                "last_run_id": row["last_run_id"] or "",
-                "changed_since_last_analysis": bool(int(row["changed_since_last_analysis"] or 0)),
-                "refresh_reason": row["refresh_reason"] or "",
-            }
-        )
+    params = (f"{query}%",) if query else ()
+    rows, count = _preview_page(conn, "patient_analysis_state", params, limit)
+
+    out = [
+        {
+            "patient_ref": row[0],
+            "status": row[1],
+            "updated_at": row[2],
+            "last_run_id": row[3] or "",
+            "changed_since_last_analysis": bool(int(row[4] or 0)),
+            "refresh_reason": row[5] or "",
+        }
+        for row in rows
+    ]
 
-    return (
-        [
-            "patient_ref",
-            "status",
-            "updated_at",
-            "last_run_id",
-            "changed_since_last_analysis",
-            "refresh_reason",
-        ],
-        out,
-        int(count["c"]) if count else 0,
-    )
+    return list(_PATIENT_ANALYSIS_STATE_PREVIEW_COLUMNS), out, count
+
+
+_PreviewFn = Callable[[sqlite3.Connection, str, int], tuple[list[str], list[dict[str, Any]], int]]
+
+_PREVIEW_DISPATCH: dict[str, _PreviewFn] = {
+    "runs": _preview_runs,
+    "run_events": _preview_run_events,
+    "patients": _preview_patients,
+    "visits": _preview_visits,
+    "events": _preview_events,
+    "inventory": _preview_inventory,
+    "documents": _preview_documents,
+    "patient_analysis_state": _preview_patient_analysis_state,
+}
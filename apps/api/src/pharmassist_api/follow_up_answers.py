@@ -1,19 +1,63 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+from pharmassist_api.privacy.phi_boundary import scan_text
 from pharmassist_api.steps.question_bank import load_question_bank
+from pharmassist_api.validators.phi_scanner import scan_for_phi
+from pharmassist_api.validators.types import Violation
+
+_YES_TOKENS = frozenset(("yes", "y", "oui", "o", "true", "1"))
+_NO_TOKENS = frozenset(("no", "n", "non", "false", "0"))
+
+# Plain decimal numbers (after "," -> "."). Checked before float() so invalid answers
+# are rejected without raising, and so float-only spellings ("1e3", "1_0", "nan",
+# "inf") are never stored as canonical answers.
+_NUMBER_RE = re.compile(r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)")
+
+# Accepted (inclusive) range and out-of-range message for number questions, by
+# question_id. Questions not listed accept any number.
+_NUMBER_RANGES: dict[str, tuple[float, float, str]] = {
+    "q_temperature": (30.0, 45.0, "Temperature must be between 30 and 45 °C."),
+    "q_duration": (0.0, 3650.0, "Duration must be between 0 and 3650 days."),
+}
+_UNBOUNDED = (float("-inf"), float("inf"), "")
 
 
 def _normalize_yes_no(answer: str) -> str | None:
     t = answer.strip().lower()
-    if t in {"yes", "y", "oui", "o", "true", "1"}:
+    if t in _YES_TOKENS:
         return "yes"
-    if t in {"no", "n", "non", "false", "0"}:
+    if t in _NO_TOKENS:
         return "no"
     return None
 
 
+@lru_cache(maxsize=1)
+def _compiled_bank() -> dict[str, dict[str, Any]]:
+    """Per-question validation data, derived once from the (immutable) question bank.
+
+    Each entry holds the `answer_type`, the allowed `choices` as a frozenset (None when
+    the configured choices are not a list of strings), the `choices_label` used in
+    error messages and the number `range` (`(lo, hi, message)`), so validating an
+    answer is a few dict lookups.
+    """
+    compiled: dict[str, dict[str, Any]] = {}
+    for qid, q in load_question_bank().items():
+        choices = q.get("choices")
+        valid = isinstance(choices, list) and all(isinstance(c, str) for c in choices)
+        compiled[qid] = {
+            "answer_type": q.get("answer_type"),
+            "choices": frozenset(choices) if valid else None,
+            "choices_label": ", ".join(choices) if valid else "",
+            "range": _NUMBER_RANGES.get(qid, _UNBOUNDED),
+        }
+    return compiled
+
+
 def validate_and_canonicalize_follow_up_answers(
     follow_up_answers: list[dict[str, Any]],
 ) -> tuple[list[dict[str, str]] | None, list[dict[str, Any]]]:
@@ -23,138 +67,178 @@ def validate_and_canonicalize_follow_up_answers(
     - (canonical_answers, []) on success
     - (None, issues) on validation errors
     """
-    bank = load_question_bank()
+    bank = _compiled_bank()
     canonical: list[dict[str, str]] = []
     issues: list[dict[str, Any]] = []
 
     for idx, item in enumerate(follow_up_answers):
-        if not isinstance(item, dict):
-            issues.append(
-                {
-                    "code": "INVALID_ITEM",
-                    "json_path": f"$.follow_up_answers[{idx}]",
-                    "message": "Answer item must be an object.",
-                }
-            )
-            continue
+        entry, issue = _canonicalize_item(bank, idx, item)
+        if issue is not None:
+            issues.append(issue)
+        elif entry is not None:
+            canonical.append(entry)
 
-        qid = item.get("question_id")
-        ans = item.get("answer")
-        if not isinstance(qid, str) or not qid.strip():
-            issues.append(
-                {
-                    "code": "MISSING_QUESTION_ID",
-                    "json_path": f"$.follow_up_answers[{idx}].question_id",
-                    "message": "question_id must be a non-empty string.",
-                }
-            )
-            continue
-        if not isinstance(ans, str) or not ans.strip():
-            issues.append(
-                {
-                    "code": "MISSING_ANSWER",
-                    "json_path": f"$.follow_up_answers[{idx}].answer",
-                    "message": "answer must be a non-empty string.",
-                }
-            )
-            continue
+    if issues:
+        return None, issues
 
-        qid = qid.strip()
-        ans = ans.strip()
-
-        q = bank.get(qid)
-        if not isinstance(q, dict):
-            issues.append(
-                {
-                    "code": "UNKNOWN_QUESTION_ID",
-                    "json_path": f"$.follow_up_answers[{idx}].question_id",
-                    "message": f"Unknown question_id: {qid}",
-                }
-            )
-            continue
+    return canonical, []
 
-        ans_type = q.get("answer_type")
-        if ans_type == "yes_no":
-            normalized = _normalize_yes_no(ans)
-            if normalized is None:
-                issues.append(
-                    {
-                        "code": "INVALID_YES_NO",
-                        "json_path": f"$.follow_up_answers[{idx}].answer",
-                        "message": "Expected yes/no answer (e.g. yes/no, oui/non).",
-                    }
-                )
-                continue
-            canonical.append({"question_id": qid, "answer": normalized})
-            continue
 
-        if ans_type == "choice":
-            choices = q.get("choices")
-            if not isinstance(choices, list) or not all(isinstance(c, str) for c in choices):
-                issues.append(
-                    {
-                        "code": "INVALID_QUESTION_CONFIG",
-                        "json_path": f"$.follow_up_answers[{idx}].question_id",
-                        "message": f"Question {qid} has invalid choices configuration.",
-                    }
-                )
-                continue
-            if ans not in set(choices):
-                issues.append(
-                    {
-                        "code": "INVALID_CHOICE",
-                        "json_path": f"$.follow_up_answers[{idx}].answer",
-                        "message": f"Answer must be one of: {', '.join(choices)}",
-                    }
-                )
-                continue
-            canonical.append({"question_id": qid, "answer": ans})
-            continue
+def screen_follow_up_answers(
+    follow_up_answers: list[dict[str, Any]],
+) -> tuple[list[Violation], list[dict[str, str]] | None, list[dict[str, Any]]]:
+    """PHI-scan, validate and canonicalize untrusted follow-up answers in one pass.
+
+    Returns:
+    - ([], canonical_answers, []) on success
+    - (phi_blockers, None, []) if any item holds PHI (validation stops at the first one)
+    - ([], None, issues) on validation errors
+    """
+    bank = _compiled_bank()
+    blockers: list[Violation] = []
+    canonical: list[dict[str, str]] = []
+    issues: list[dict[str, Any]] = []
 
-        if ans_type == "number":
-            t = ans.replace(",", ".")
-            try:
-                value = float(t)
-            except ValueError:
-                issues.append(
-                    {
-                        "code": "INVALID_NUMBER",
-                        "json_path": f"$.follow_up_answers[{idx}].answer",
-                        "message": "Expected a numeric answer.",
-                    }
-                )
-                continue
-            if qid == "q_temperature" and not (30.0 <= value <= 45.0):
-                issues.append(
-                    {
-                        "code": "NUMBER_OUT_OF_RANGE",
-                        "json_path": f"$.follow_up_answers[{idx}].answer",
-                        "message": "Temperature must be between 30 and 45 °C.",
-                    }
-                )
-                continue
-            if qid == "q_duration" and not (0.0 <= value <= 3650.0):
-                issues.append(
-                    {
-                        "code": "NUMBER_OUT_OF_RANGE",
-                        "json_path": f"$.follow_up_answers[{idx}].answer",
-                        "message": "Duration must be between 0 and 3650 days.",
-                    }
-                )
-                continue
-            canonical.append({"question_id": qid, "answer": ans})
+    for idx, item in enumerate(follow_up_answers):
+        item_path = f"$.follow_up_answers[{idx}]"
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if key == "answer" and isinstance(value, str):
+                    # `scan_text` covers the structural scanner's text checks and adds
+                    # label-like PHI ("Nom: ...") as defense in depth.
+                    found = scan_text(value, json_path=f"{item_path}.answer")
+                else:
+                    found = scan_for_phi({key: value}, path=item_path)
+                blockers.extend(v for v in found if v.severity == "BLOCKER")
+        else:
+            blockers.extend(
+                v for v in scan_for_phi(item, path=item_path) if v.severity == "BLOCKER"
+            )
+        if blockers:
             continue
 
-        issues.append(
-            {
-                "code": "UNSUPPORTED_ANSWER_TYPE",
-                "json_path": f"$.follow_up_answers[{idx}].question_id",
-                "message": f"Unsupported answer_type for question {qid}: {ans_type}",
-            }
-        )
+        entry, issue = _canonicalize_item(bank, idx, item)
+        if issue is not None:
+            issues.append(issue)
+        elif entry is not None:
+            canonical.append(entry)
 
+    if blockers:
+        return blockers, None, []
     if issues:
-        return None, issues
-
-    return canonical, []
-
+        return [], None, issues
+
+    return [], canonical, []
+
+
+def _canonicalize_item(
+    bank: dict[str, dict[str, Any]], idx: int, item: Any
+) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+    """Validate one answer item: `(canonical_entry, None)` or `(None, issue)`."""
+    if not isinstance(item, dict):
+        return None, {
+            "code": "INVALID_ITEM",
+            "json_path": f"$.follow_up_answers[{idx}]",
+            "message": "Answer item must be an object.",
+        }
+
+    qid = item.get("question_id")
+    ans = item.get("answer")
+    if not isinstance(qid, str) or not qid.strip():
+        return None, {
+            "code": "MISSING_QUESTION_ID",
+            "json_path": f"$.follow_up_answers[{idx}].question_id",
+            "message": "question_id must be a non-empty string.",
+        }
+    if not isinstance(ans, str) or not ans.strip():
+        return None, {
+            "code": "MISSING_ANSWER",
+            "json_path": f"$.follow_up_answers[{idx}].answer",
+            "message": "answer must be a non-empty string.",
+        }
+
+    qid = qid.strip()
+    ans = ans.strip()
+
+    q = bank.get(qid)
+    if q is None:
+        return None, {
+            "code": "UNKNOWN_QUESTION_ID",
+            "json_path": f"$.follow_up_answers[{idx}].question_id",
+            "message": f"Unknown question_id: {qid}",
+        }
+
+    handler = _DISPATCH.get(q["answer_type"])
+    if handler is None:
+        return None, {
+            "code": "UNSUPPORTED_ANSWER_TYPE",
+            "json_path": f"$.follow_up_answers[{idx}].question_id",
+            "message": f"Unsupported answer_type for question {qid}: {q['answer_type']}",
+        }
+    return handler(qid, ans, q, idx)
+
+
+# Per-answer_type handlers: (question_id, stripped answer, compiled bank entry, item index)
+# -> `(canonical_entry, None)` or `(None, issue)`.
+_Handler = Callable[
+    [str, str, dict[str, Any], int], tuple[dict[str, str] | None, dict[str, Any] | None]
+]
+
+
+def _handle_yes_no(
+    qid: str, ans: str, q: dict[str, Any], idx: int
+) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+    normalized = _normalize_yes_no(ans)
+    if normalized is None:
+        return None, {
+            "code": "INVALID_YES_NO",
+            "json_path": f"$.follow_up_answers[{idx}].answer",
+            "message": "Expected yes/no answer (e.g. yes/no, oui/non).",
+        }
+    return {"question_id": qid, "answer": normalized}, None
+
+
+def _handle_choice(
+    qid: str, ans: str, q: dict[str, Any], idx: int
+) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+    choices = q["choices"]
+    if choices is None:
+        return None, {
+            "code": "INVALID_QUESTION_CONFIG",
+            "json_path": f"$.follow_up_answers[{idx}].question_id",
+            "message": f"Question {qid} has invalid choices configuration.",
+        }
+    if ans not in choices:
+        return None, {
+            "code": "INVALID_CHOICE",
+            "json_path": f"$.follow_up_answers[{idx}].answer",
+            "message": f"Answer must be one of: {q['choices_label']}",
+        }
+    return {"question_id": qid, "answer": ans}, None
+
+
+def _handle_number(
+    qid: str, ans: str, q: dict[str, Any], idx: int
+) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+    t = ans.replace(",", ".")
+    if _NUMBER_RE.fullmatch(t) is None:
+        return None, {
+            "code": "INVALID_NUMBER",
+            "json_path": f"$.follow_up_answers[{idx}].answer",
+            "message": "Expected a numeric answer.",
+        }
+    lo, hi, message = q["range"]
+    if not (lo <= float(t) <= hi):
+        return None, {
+            "code": "NUMBER_OUT_OF_RANGE",
+            "json_path": f"$.follow_up_answers[{idx}].answer",
+            "message": message,
+        }
+    return {"question_id": qid, "answer": ans}, None
+
+
+_DISPATCH: dict[str, _Handler] = {
+    "yes_no": _handle_yes_no,
+    "choice": _handle_choice,
+    "number": _handle_number,
+}
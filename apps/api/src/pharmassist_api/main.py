@@ -12,23 +12,28 @@ from typing import Annotated, Any, Literal
 
 from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from pharmassist_api import db
 from pharmassist_api.analysis_refresh import (
+    aget_patient_analysis_status,
+    aget_patients_inbox,
     get_patient_analysis_status,
-    get_patients_inbox,
     queue_patient_refresh,
     reset_analysis_refresh_state_for_tests,
+    stop_refresh_worker,
 )
 from pharmassist_api.contracts.validate_schema import validate_instance
-from pharmassist_api.follow_up_answers import validate_and_canonicalize_follow_up_answers
-from pharmassist_api.orchestrator import dumps_sse, get_queue, new_run_with_answers, run_pipeline
+from pharmassist_api.follow_up_answers import screen_follow_up_answers
+from pharmassist_api.orchestrator import (
+    get_queue,
+    new_run_with_answers,
+    run_pipeline,
+    sse_frame,
+)
 from pharmassist_api.pharmacy import ensure_pharmacy_dataset_loaded
 from pharmassist_api.pharmacy.prescription_upload import ingest_prescription_pdf, max_upload_bytes
-from pharmassist_api.privacy.phi_boundary import scan_text
-from pharmassist_api.validators.phi_scanner import scan_for_phi
 
 
 class FollowUpAnswer(BaseModel):
@@ -59,9 +64,17 @@ async def lifespan(_app: FastAPI):
         # Keep the Kaggle demo resilient: case_ref-based runs still work even if dataset is missing.
         pass
     yield
+    await stop_refresh_worker()
+    db.close_cached_connections()
 
 
-app = FastAPI(title="PharmAssist Kaggle Demo API", version="0.0.0", lifespan=lifespan)
+# orjson renders every JSON body (the default JSONResponse uses the stdlib encoder).
+app = FastAPI(
+    title="PharmAssist Kaggle Demo API",
+    version="0.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -82,6 +95,10 @@ _ADMIN_RATE_LOCK = threading.Lock()
 _ADMIN_RATE_BUCKETS: dict[str, deque[float]] = {}
 _STREAM_TOKEN_LOCK = threading.Lock()
 _STREAM_TOKENS: dict[str, tuple[str, float]] = {}
+# Max live SSE events coalesced into one response chunk.
+_SSE_BATCH_MAX = 32
+# Stored events read (in a worker thread) and sent per replay chunk.
+_SSE_REPLAY_PAGE_SIZE = 256
 
 
 def _env_int(name: str, default: int, *, low: int, high: int) -> int:
@@ -323,40 +340,27 @@ def root() -> dict[str, str]:
 
 
 @app.post("/runs")
-async def create_run(request: Request, req: RunCreateRequest) -> dict[str, Any]:
+async def create_run(request: Request, req: RunCreateRequest) -> ORJSONResponse:
     _enforce_data_controls(request, endpoint="/runs")
+    # The models are already validated; build the plain dicts directly rather than via
+    # `model_dump()`'s generic serializer.
     follow_up_answers = (
-        [a.model_dump() for a in req.follow_up_answers] if req.follow_up_answers else None
+        [{"question_id": a.question_id, "answer": a.answer} for a in req.follow_up_answers]
+        if req.follow_up_answers
+        else None
     )
     if follow_up_answers:
-        violations = scan_for_phi(follow_up_answers, path="$.follow_up_answers")
-        # Defense in depth: treat "label-like" PHI (e.g. "Nom: ...") as BLOCKER too.
-        for idx, item in enumerate(follow_up_answers):
-            if not isinstance(item, dict):
-                continue
-            ans = item.get("answer")
-            if isinstance(ans, str) and ans.strip():
-                violations.extend(scan_text(ans, json_path=f"$.follow_up_answers[{idx}].answer"))
-        blockers = [v for v in violations if v.severity == "BLOCKER"]
+        blockers, canonical, issues = screen_follow_up_answers(follow_up_answers)
         if blockers:
             # Do not persist identifier-like content from untrusted UI input.
             raise HTTPException(
                 status_code=400,
                 detail={
                     "error": "PHI detected in follow_up_answers",
-                    "violations": [
-                        {
-                            "code": v.code,
-                            "severity": v.severity,
-                            "json_path": v.json_path,
-                            "message": v.message,
-                        }
-                        for v in blockers
-                    ],
+                    "violations": [v.to_dict() for v in blockers],
                 },
             )
 
-        canonical, issues = validate_and_canonicalize_follow_up_answers(follow_up_answers)
         if issues:
             raise HTTPException(
                 status_code=400,
@@ -379,13 +383,11 @@ async def create_run(request: Request, req: RunCreateRequest) -> dict[str, Any]:
         follow_up_answers=follow_up_answers,
     )
 
-    # Ensure our API output follows the canonical contract early.
-    validate_instance(run, "run")
-
     # Kick off the background pipeline.
     asyncio.create_task(run_pipeline(run["run_id"]))
 
-    return run
+    # Already validated against the "run" schema by new_run_with_answers.
+    return ORJSONResponse(run)
 
 
 @app.get("/patients")
@@ -400,14 +402,14 @@ def search_patients(
 
 
 @app.get("/patients/inbox")
-def patients_inbox(
+async def patients_inbox(
     request: Request,
     limit: int = Query(default=50, ge=1, le=200),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     _enforce_data_controls(request, endpoint="/patients/inbox")
-    payload = get_patients_inbox(limit=limit)
+    payload = await aget_patients_inbox(limit=limit)
     validate_instance(payload, "patient_inbox")
-    return payload
+    return ORJSONResponse(payload)
 
 
 @app.get("/patients/{patient_ref}")
@@ -422,8 +424,7 @@ def get_patient(request: Request, patient_ref: str) -> dict[str, Any]:
 @app.get("/patients/{patient_ref}/visits")
 def get_patient_visits(request: Request, patient_ref: str) -> dict[str, Any]:
     _enforce_data_controls(request, endpoint="/patients/{patient_ref}/visits")
-    patient = db.get_patient(patient_ref)
-    if not patient:
+    if not db.patient_exists(patient_ref):
         raise HTTPException(status_code=404, detail="Patient not found")
     return {
         "patient_ref": patient_ref,
@@ -432,14 +433,13 @@ def get_patient_visits(request: Request, patient_ref: str) -> dict[str, Any]:
 
 
 @app.get("/patients/{patient_ref}/analysis-status")
-def patient_analysis_status(request: Request, patient_ref: str) -> dict[str, Any]:
+def patient_analysis_status(request: Request, patient_ref: str) -> ORJSONResponse:
     _enforce_data_controls(request, endpoint="/patients/{patient_ref}/analysis-status")
-    patient = db.get_patient(patient_ref)
-    if not patient:
+    if not db.patient_exists(patient_ref):
         raise HTTPException(status_code=404, detail="Patient not found")
     payload = get_patient_analysis_status(patient_ref=patient_ref)
     validate_instance(payload, "patient_analysis_status")
-    return payload
+    return ORJSONResponse(payload)
 
 
 @app.post("/patients/{patient_ref}/refresh")
@@ -449,13 +449,12 @@ async def refresh_patient_analysis(
     req: PatientRefreshRequest | None = None,
 ) -> dict[str, Any]:
     _enforce_data_controls(request, endpoint="/patients/{patient_ref}/refresh")
-    patient = db.get_patient(patient_ref)
-    if not patient:
+    if not db.patient_exists(patient_ref):
         raise HTTPException(status_code=404, detail="Patient not found")
 
     reason = req.reason if req else "manual_refresh"
     queued = await queue_patient_refresh(patient_ref=patient_ref, reason=reason)
-    payload = get_patient_analysis_status(patient_ref=patient_ref)
+    payload = await aget_patient_analysis_status(patient_ref=patient_ref)
     validate_instance(payload, "patient_analysis_status")
     return {
         "schema_version": "0.0.0",
@@ -477,7 +476,7 @@ async def upload_prescription_pdf(
     patient_ref_norm = patient_ref.strip()
     if not patient_ref_norm:
         raise HTTPException(status_code=400, detail="patient_ref is required")
-    if not db.get_patient(patient_ref_norm):
+    if not db.patient_exists(patient_ref_norm):
         raise HTTPException(status_code=404, detail="Patient not found")
 
     filename = (file.filename or "").strip()
@@ -613,7 +612,7 @@ def get_db_preview(
     table: str = Query(min_length=1, max_length=32),
     query: str = Query(default="", min_length=0, max_length=64),
     limit: int = Query(default=50, ge=1, le=100),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     query_norm = (query or "").strip()
     table_norm = (table or "").strip().lower()
     _enforce_admin_controls(
@@ -631,22 +630,23 @@ def get_db_preview(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     validate_instance(payload, "db_preview")
-    return payload
+    return ORJSONResponse(payload)
 
 
 @app.get("/runs/{run_id}")
-def get_run(request: Request, run_id: str) -> dict[str, Any]:
+def get_run(request: Request, run_id: str) -> Response:
     _enforce_data_controls(request, endpoint="/runs/{run_id}")
-    run = db.get_run(run_id)
-    if not run:
+    # Returned as stored: SQLite assembles the JSON body, so Python never parses it.
+    run_json = db.get_run_json(run_id)
+    if run_json is None:
         raise HTTPException(status_code=404, detail="Run not found")
-    return run
+    return Response(content=run_json, media_type="application/json")
 
 
 @app.post("/runs/{run_id}/events-token")
 def create_run_events_token(request: Request, run_id: str) -> dict[str, Any]:
     _enforce_data_controls(request, endpoint="/runs/{run_id}/events-token")
-    if not db.get_run(run_id):
+    if not db.run_exists(run_id):
         raise HTTPException(status_code=404, detail="Run not found")
     token, ttl = _issue_stream_token(run_id=run_id)
     return {"run_id": run_id, "stream_token": token, "expires_in_sec": ttl}
@@ -675,11 +675,22 @@ async def run_events(
             if last and last.isdigit():
                 after_id = int(last)
 
-        # 1) Replay history from DB (useful on refresh/reconnect).
-        for item in db.list_events(run_id, after_id=after_id):
-            eid = int(item["id"])
-            data = dict(item["data"])
-            yield dumps_sse(data, event_id=eid, event=str(data.get("type") or "message"))
+        # 1) Replay history from DB (useful on refresh/reconnect). Stored payloads are
+        # compact JSON already, so they are forwarded without a decode/encode round trip.
+        # Each page is read in a worker thread so disk I/O never stalls the event loop
+        # (and with it every other connected SSE client).
+        while True:
+            rows = await asyncio.to_thread(
+                db.list_event_rows, run_id, after_id=after_id, limit=_SSE_REPLAY_PAGE_SIZE
+            )
+            if rows:
+                yield "".join(
+                    sse_frame(data_json, event_id=eid, event=event_type or "message")
+                    for eid, event_type, data_json in rows
+                )
+                after_id = rows[-1][0]
+            if len(rows) < _SSE_REPLAY_PAGE_SIZE:
+                break
 
         # 2) Subscribe to live events.
         q = get_queue(run_id)
@@ -688,17 +699,30 @@ async def run_events(
                 break
 
             try:
-                msg = await asyncio.wait_for(q.get(), timeout=15)
+                async with asyncio.timeout(15):
+                    msg = await q.get()
             except TimeoutError:
                 # Keep-alive comment.
                 yield ": keep-alive\n\n"
                 continue
 
-            eid = int(msg["id"])
-            data = dict(msg["data"])
-            yield dumps_sse(data, event_id=eid, event=str(data.get("type") or "message"))
-
-            if data.get("type") == "finalized":
+            # Drain the events already queued behind it (pipeline bursts) into a single
+            # chunk: one ASGI send instead of one per event.
+            batch = [msg]
+            while len(batch) < _SSE_BATCH_MAX and not q.empty():
+                batch.append(q.get_nowait())
+
+            # Frames come pre-serialized from the orchestrator (see `_publish`).
+            frames: list[str] = []
+            finalized = False
+            for item in batch:
+                frames.append(item["frame"])
+                if item["type"] == "finalized":
+                    finalized = True
+                    break
+            yield "".join(frames)
+
+            if finalized:
                 break
 
     return StreamingResponse(
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import uuid
-from datetime import UTC, datetime
 from hashlib import sha256
 from typing import Any
 
+import orjson
+
 from . import db
 from .cases.load_case import load_case_bundle
 from .contracts.validate_schema import validate_instance
-from .follow_up_answers import validate_and_canonicalize_follow_up_answers
-from .privacy.phi_boundary import PhiBoundaryError, raise_if_phi, scan_text
+from .follow_up_answers import screen_follow_up_answers
+from .privacy.phi_boundary import PhiBoundaryError, raise_if_phi
 from .steps.a1_intake_extraction import extract_intake
 from .steps.a3_triage import triage_and_followup
 from .steps.a4_evidence_retrieval import retrieve_evidence
@@ -21,7 +21,6 @@ from .steps.a7_report_composer import compose_report_markdown
 from .steps.a8_handout import compose_handout_markdown
 from .steps.a8_prebrief import compose_prebrief
 from .steps.a9_planner import build_planner_plan, planner_feature_enabled
-from .validators.phi_scanner import scan_for_phi
 from .validators.policy_validate import validate_payload
 
 SCHEMA_VERSION = "0.0.0"
@@ -42,11 +41,12 @@ PIPELINE_STEPS = [
 ]
 
 # In-memory per-run queues for SSE. Assumes a single-process server (OK for Kaggle demo).
+# Messages are `{"id", "type", "frame"}` with the SSE frame already serialized.
 _RUN_QUEUES: dict[str, asyncio.Queue[dict[str, Any]]] = {}
 
 
 def _now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    return db.now_iso()
 
 
 def get_queue(run_id: str) -> asyncio.Queue[dict[str, Any]]:
@@ -58,9 +58,17 @@ def get_queue(run_id: str) -> asyncio.Queue[dict[str, Any]]:
 
 
 def _publish(run_id: str, *, event_id: int, data: dict[str, Any]) -> None:
-    # Non-blocking publish; SSE loop will drain.
+    # Non-blocking publish; SSE loop will drain. The frame is serialized here, once per
+    # event, so the SSE loop only forwards strings.
+    event_type = str(data.get("type") or "message")
     q = get_queue(run_id)
-    q.put_nowait({"id": event_id, "data": data})
+    q.put_nowait(
+        {
+            "id": event_id,
+            "type": event_type,
+            "frame": dumps_sse(data, event_id=event_id, event=event_type),
+        }
+    )
 
 
 def emit_event(run_id: str, event_type: str, payload: dict[str, Any]) -> int:
@@ -71,6 +79,18 @@ def emit_event(run_id: str, event_type: str, payload: dict[str, Any]) -> int:
     return event_id
 
 
+def emit_events(run_id: str, events: list[tuple[str, dict[str, Any]]]) -> list[int]:
+    """Emit back-to-back events with a single DB transaction (same order as given)."""
+    event_payloads: list[tuple[str, dict[str, Any]]] = []
+    for event_type, payload in events:
+        ts = payload.get("ts") or _now_iso()
+        event_payloads.append((event_type, {**payload, "ts": ts, "type": event_type}))
+    event_ids = db.insert_events(run_id, event_payloads)
+    for event_id, (_event_type, event_payload) in zip(event_ids, event_payloads, strict=True):
+        _publish(run_id, event_id=event_id, data=event_payload)
+    return event_ids
+
+
 def new_run(*, case_ref: str, language: str, trigger: str) -> dict[str, Any]:
     return new_run_with_answers(
         case_ref=case_ref,
@@ -93,19 +113,10 @@ def new_run_with_answers(
     created_at = _now_iso()
 
     if follow_up_answers:
-        violations = scan_for_phi(follow_up_answers, path="$.follow_up_answers")
-        # Defense in depth: treat "label-like" PHI (e.g. "Nom: ...") as BLOCKER too.
-        for idx, item in enumerate(follow_up_answers):
-            if not isinstance(item, dict):
-                continue
-            ans = item.get("answer")
-            if isinstance(ans, str) and ans.strip():
-                violations.extend(scan_text(ans, json_path=f"$.follow_up_answers[{idx}].answer"))
-        blockers = [v for v in violations if v.severity == "BLOCKER"]
+        blockers, canonical, issues = screen_follow_up_answers(follow_up_answers)
         if blockers:
             raise ValueError("PHI detected in follow_up_answers")
 
-        canonical, issues = validate_and_canonicalize_follow_up_answers(follow_up_answers)
         if issues:
             first = issues[0]
             raise ValueError(
@@ -222,27 +233,26 @@ async def run_pipeline(run_id: str) -> None:
     recommendation: dict[str, Any] | None = None
     follow_up_answers = run.get("input", {}).get("follow_up_answers")
 
+    # A step's `step_completed` is written together with the next `step_started`: the two
+    # are back to back (no await in between), so one transaction (and one commit) covers
+    # both instead of one per event. SSE order and ids are unchanged.
+    step_completed: tuple[str, dict[str, Any]] | None = None
     for step in PIPELINE_STEPS:
-        emit_event(
-            run_id,
+        step_started = (
             "step_started",
             {"step": step, "message": f"Starting {step}.", "ts": _now_iso()},
         )
+        if step_completed is None:
+            emit_event(run_id, *step_started)
+        else:
+            emit_events(run_id, [step_completed, step_started])
 
         if step == "A2_phi_scrubber":
             # Hard-stop PHI boundary (defense-in-depth).
             try:
                 raise_if_phi(str(ocr_text), "$.intake_text_ocr")
             except PhiBoundaryError as e:
-                violations = [
-                    {
-                        "code": v.code,
-                        "severity": v.severity,
-                        "json_path": v.json_path,
-                        "message": v.message,
-                    }
-                    for v in e.violations
-                ]
+                violations = [v.to_dict() for v in e.violations]
                 db.update_run(run_id, status="failed_safe", policy_violations=violations)
                 emit_event(
                     run_id,
@@ -285,15 +295,7 @@ async def run_pipeline(run_id: str) -> None:
                 try:
                     intake_extracted = extract_intake(str(ocr_text), language)
                 except PhiBoundaryError as e:
-                    violations = [
-                        {
-                            "code": v.code,
-                            "severity": v.severity,
-                            "json_path": v.json_path,
-                            "message": v.message,
-                        }
-                        for v in e.violations
-                    ]
+                    violations = [v.to_dict() for v in e.violations]
                     db.update_run(run_id, status="failed_safe", policy_violations=violations)
                     emit_event(
                         run_id,
@@ -699,12 +701,14 @@ async def run_pipeline(run_id: str) -> None:
             # Simulate work; keeps the UI feeling alive without heavy computation.
             await asyncio.sleep(0.25)
 
-        emit_event(
-            run_id,
+        step_completed = (
             "step_completed",
             {"step": step, "message": f"Completed {step}.", "ts": _now_iso()},
         )
 
+    if step_completed is not None:
+        emit_event(run_id, *step_completed)
+
     # Fallback placeholder artifacts (only if a step didn't set them).
     symptoms_line = ""
     if isinstance(intake_extracted, dict):
@@ -752,15 +756,7 @@ async def run_pipeline(run_id: str) -> None:
     violations = validate_payload(candidate_run, schema_name="run")
     blockers = [v for v in violations if v.severity == "BLOCKER"]
     if blockers:
-        policy_violations = [
-            {
-                "code": v.code,
-                "severity": v.severity,
-                "json_path": v.json_path,
-                "message": v.message,
-            }
-            for v in blockers
-        ]
+        policy_violations = [v.to_dict() for v in blockers]
         safe_artifacts: dict[str, Any] = {}
         if isinstance(artifacts.get("trace"), dict):
             safe_artifacts["trace"] = artifacts["trace"]
@@ -771,22 +767,25 @@ async def run_pipeline(run_id: str) -> None:
             artifacts=safe_artifacts,
             policy_violations=policy_violations,
         )
-        emit_event(
+        emit_events(
             run_id,
-            "policy_violation",
-            {
-                "step": "finalize",
-                "message": "Policy validation failed; stopping safely.",
-                "ocr_len": ocr_len,
-                "ocr_sha256_12": ocr_sha,
-                "violations": policy_violations,
-                "ts": _now_iso(),
-            },
-        )
-        emit_event(
-            run_id,
-            "finalized",
-            {"message": "Run failed_safe (policy violation).", "ts": _now_iso()},
+            [
+                (
+                    "policy_violation",
+                    {
+                        "step": "finalize",
+                        "message": "Policy validation failed; stopping safely.",
+                        "ocr_len": ocr_len,
+                        "ocr_sha256_12": ocr_sha,
+                        "violations": policy_violations,
+                        "ts": _now_iso(),
+                    },
+                ),
+                (
+                    "finalized",
+                    {"message": "Run failed_safe (policy violation).", "ts": _now_iso()},
+                ),
+            ],
         )
         _RUN_QUEUES.pop(run_id, None)
         return
@@ -807,12 +806,18 @@ def dumps_sse(
     data: dict[str, Any], *, event_id: int | None = None, event: str | None = None
 ) -> str:
     """Serialize an SSE message."""
+    # Compact UTF-8 (orjson), like the stored run event payloads replayed via sse_frame.
+    return sse_frame(orjson.dumps(data).decode(), event_id=event_id, event=event)
+
+
+def sse_frame(data_json: str, *, event_id: int | None = None, event: str | None = None) -> str:
+    """Build an SSE message around an already-serialized (single-line) JSON payload."""
     lines: list[str] = []
     if event_id is not None:
         lines.append(f"id: {event_id}")
     if event is not None:
         lines.append(f"event: {event}")
-    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    lines.append(f"data: {data_json}")
     return "\n".join(lines) + "\n\n"
 
 
@@ -852,7 +857,7 @@ def _build_trace_artifact(run_id: str) -> dict[str, Any]:
     """
     events: list[dict[str, Any]] = []
 
-    for item in db.list_events(run_id):
+    for item in db.iter_events(run_id):
         data = item.get("data") or {}
         if not isinstance(data, dict):
             continue
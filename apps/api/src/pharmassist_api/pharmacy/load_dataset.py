@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import gzip
-import json
 import os
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from pharmassist_api import db
 from pharmassist_api.contracts.validate_schema import validate_instance
 
+_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Tables written by the dataset bulk load (their secondary indexes are rebuilt after).
+_BULK_LOAD_TABLES = ("visits", "events")
+
 
 def default_dataset_dir() -> Path:
-    return Path(__file__).resolve().parent / "fixtures" / "paris15_mini"
+    return _FIXTURES_DIR / "paris15_mini"
 
 
 def resolve_dataset_dir() -> Path:
@@ -23,7 +29,7 @@ def resolve_dataset_dir() -> Path:
 
 
 def default_catalog_demo_path() -> Path:
-    return Path(__file__).resolve().parent / "fixtures" / "catalog" / "products.demo.json"
+    return _FIXTURES_DIR / "catalog" / "products.demo.json"
 
 
 def resolve_catalog_demo_path() -> Path:
@@ -34,12 +40,13 @@ def resolve_catalog_demo_path() -> Path:
 
 
 def _iter_jsonl_gz(path: Path) -> Iterable[Any]:
-    with gzip.open(path, "rt", encoding="utf-8") as f:
+    # Binary mode: orjson parses the UTF-8 bytes directly (no per-line str decode).
+    with gzip.open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield orjson.loads(line)
 
 
 def _sanitize_event_payload(event_type: str, payload: dict[str, Any]) -> dict[str, Any] | None:
@@ -156,7 +163,35 @@ def ensure_pharmacy_dataset_loaded(*, dataset_dir: Path | None = None) -> dict[s
             "patients.jsonl.gz, visits.jsonl.gz, events.jsonl.gz, inventory.jsonl.gz"
         )
 
-    patients_loaded = 0
+    # Bulk load: rebuild the dataset-table indexes once at the end instead of
+    # maintaining them row by row.
+    db.drop_secondary_indexes(tables=_BULK_LOAD_TABLES)
+    try:
+        counts = _load_dataset_files(
+            patients_path=patients_path,
+            visits_path=visits_path,
+            events_path=events_path,
+            inventory_path=inventory_path,
+        )
+    finally:
+        db.create_secondary_indexes(tables=_BULK_LOAD_TABLES)
+
+    catalog_loaded = _load_catalog_demo_products(resolve_catalog_demo_path())
+
+    return {
+        "loaded": 1,
+        **counts,
+        "catalog_loaded": catalog_loaded,
+        "patients": db.count_patients(),
+        "visits": db.count_visits(),
+        "inventory": db.count_inventory(),
+    }
+
+
+def _load_dataset_files(
+    *, patients_path: Path, visits_path: Path, events_path: Path, inventory_path: Path
+) -> dict[str, int]:
+    patients: list[tuple[str, dict[str, Any]]] = []
     for raw in _iter_jsonl_gz(patients_path):
         if not isinstance(raw, dict):
             continue
@@ -167,10 +202,10 @@ def ensure_pharmacy_dataset_loaded(*, dataset_dir: Path | None = None) -> dict[s
         if not isinstance(llm_context, dict):
             continue
         validate_instance(llm_context, "llm_context")
-        db.upsert_patient(patient_ref=patient_ref, llm_context=llm_context)
-        patients_loaded += 1
+        patients.append((patient_ref, llm_context))
+    db.upsert_patients(patients)
 
-    visits_loaded = 0
+    visits: list[dict[str, Any]] = []
     for raw in _iter_jsonl_gz(visits_path):
         if not isinstance(raw, dict):
             continue
@@ -194,17 +229,19 @@ def ensure_pharmacy_dataset_loaded(*, dataset_dir: Path | None = None) -> dict[s
             continue
         validate_instance(intake_extracted, "intake_extracted")
 
-        db.upsert_visit(
-            visit_ref=visit_ref,
-            patient_ref=patient_ref,
-            occurred_at=occurred_at,
-            primary_domain=primary_domain,
-            intents=intents,
-            intake_extracted=intake_extracted,
+        visits.append(
+            {
+                "visit_ref": visit_ref,
+                "patient_ref": patient_ref,
+                "occurred_at": occurred_at,
+                "primary_domain": primary_domain,
+                "intents": intents,
+                "intake_extracted": intake_extracted,
+            }
         )
-        visits_loaded += 1
+    db.upsert_visits(visits)
 
-    events_loaded = 0
+    events: list[dict[str, Any]] = []
     for raw in _iter_jsonl_gz(events_path):
         if not isinstance(raw, dict):
             continue
@@ -232,17 +269,19 @@ def ensure_pharmacy_dataset_loaded(*, dataset_dir: Path | None = None) -> dict[s
             continue
         validate_instance(payload_sanitized, "pharmacy_event_payload")
 
-        db.upsert_pharmacy_event(
-            event_ref=event_ref,
-            visit_ref=visit_ref,
-            patient_ref=patient_ref,
-            occurred_at=occurred_at,
-            event_type=event_type,
-            payload=payload_sanitized,
+        events.append(
+            {
+                "event_ref": event_ref,
+                "visit_ref": visit_ref,
+                "patient_ref": patient_ref,
+                "occurred_at": occurred_at,
+                "event_type": event_type,
+                "payload": payload_sanitized,
+            }
         )
-        events_loaded += 1
+    db.upsert_pharmacy_events(events)
 
-    inv_loaded = 0
+    inventory: list[tuple[str, dict[str, Any]]] = []
     for raw in _iter_jsonl_gz(inventory_path):
         if not isinstance(raw, dict):
             continue
@@ -250,21 +289,14 @@ def ensure_pharmacy_dataset_loaded(*, dataset_dir: Path | None = None) -> dict[s
         if not (isinstance(sku, str) and sku):
             continue
         validate_instance(raw, "product")
-        db.upsert_inventory_product(sku=sku, product=raw)
-        inv_loaded += 1
-
-    catalog_loaded = _load_catalog_demo_products(resolve_catalog_demo_path())
+        inventory.append((sku, raw))
+    db.upsert_inventory_products(inventory)
 
     return {
-        "loaded": 1,
-        "patients_loaded": patients_loaded,
-        "visits_loaded": visits_loaded,
-        "events_loaded": events_loaded,
-        "inventory_loaded": inv_loaded,
-        "catalog_loaded": catalog_loaded,
-        "patients": db.count_patients(),
-        "visits": db.count_visits(),
-        "inventory": db.count_inventory(),
+        "patients_loaded": len(patients),
+        "visits_loaded": len(visits),
+        "events_loaded": len(events),
+        "inventory_loaded": len(inventory),
     }
 
 
@@ -272,13 +304,13 @@ def _load_catalog_demo_products(path: Path) -> int:
     if not path.exists():
         return 0
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = orjson.loads(path.read_bytes())
     except Exception:
         return 0
     if not isinstance(payload, list):
         return 0
 
-    loaded = 0
+    products: list[tuple[str, dict[str, Any]]] = []
     for row in payload:
         if not isinstance(row, dict):
             continue
@@ -289,6 +321,6 @@ def _load_catalog_demo_products(path: Path) -> int:
             validate_instance(row, "product")
         except Exception:
             continue
-        db.upsert_inventory_product(sku=sku, product=row)
-        loaded += 1
-    return loaded
+        products.append((sku, row))
+    db.upsert_inventory_products(products)
+    return len(products)
@@ -224,15 +224,7 @@ def ingest_prescription_pdf(
     try:
         raise_if_phi(redacted_full_text, "$.documents.prescription.redacted_text_full")
     except PhiBoundaryError as e:
-        violations = [
-            {
-                "code": v.code,
-                "severity": v.severity,
-                "json_path": v.json_path,
-                "message": v.message,
-            }
-            for v in e.violations
-        ]
+        violations = [v.to_dict() for v in e.violations]
         return {
             "status": "failed_phi_boundary",
             "doc_ref": doc_ref,
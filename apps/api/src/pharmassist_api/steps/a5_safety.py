@@ -102,6 +102,7 @@ def compute_safety_warnings(
                 "confidence": 0.1,
             },
             "recommendation",
+            cache_clean=True,
         ):
             safe.append(w)
     return safe
@@ -115,14 +115,14 @@ def rank_products(
     safe_ranked: list[dict[str, Any]] = []
     for item in ranked_products:
         if not validate_or_return_errors(
-            {**base_reco, "ranked_products": [item]}, "recommendation"
+            {**base_reco, "ranked_products": [item]}, "recommendation", cache_clean=True
         ):
             safe_ranked.append(item)
 
     safe_warnings: list[dict[str, Any]] = []
     for w in warnings:
         if not validate_or_return_errors(
-            {**base_reco, "safety_warnings": [w]}, "recommendation"
+            {**base_reco, "safety_warnings": [w]}, "recommendation", cache_clean=True
         ):
             safe_warnings.append(w)
 
@@ -6,10 +6,19 @@ from typing import Literal
 Severity = Literal["BLOCKER", "WARN"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Violation:
     code: str
     severity: Severity
     json_path: str
     message: str
 
+    def to_dict(self) -> dict[str, str]:
+        """JSON form used in API errors, run events and `policy_violations`."""
+        return {
+            "code": self.code,
+            "severity": self.severity,
+            "json_path": self.json_path,
+            "message": self.message,
+        }
+
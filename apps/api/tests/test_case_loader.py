@@ -1,6 +1,8 @@
+import re
+
 import pytest
 
-from pharmassist_api.cases.load_case import load_case_bundle
+from pharmassist_api.cases.load_case import _is_valid_case_ref, load_case_bundle
 from pharmassist_api.contracts.validate_schema import validate_instance
 
 
@@ -22,3 +24,40 @@ def test_load_case_bundle_has_expected_shape(case_ref: str):
 
     for p in bundle["products"]:
         assert validate_instance(p, "product") is None
+
+
+def test_load_case_bundle_returns_independent_copies():
+    first = load_case_bundle("case_000042")
+    first["llm_context"]["mutated"] = True
+
+    second = load_case_bundle("case_000042")
+    assert "mutated" not in second["llm_context"]
+
+
+def test_load_case_bundle_rejects_unknown_ref():
+    with pytest.raises(ValueError, match="unknown case_ref"):
+        load_case_bundle("case_999999")
+    with pytest.raises(ValueError, match="unknown case_ref"):
+        load_case_bundle("../etc/passwd")
+
+
+@pytest.mark.parametrize(
+    "case_ref",
+    [
+        "case_000042",
+        "case_redflag_000101",
+        "case_00004",
+        "case_" + "a" * 32,
+        "case_" + "a" * 33,
+        "case_00004A",
+        "case_0000-42",
+        "case_000042\n",
+        "case_../../x",
+        "Case_000042",
+        "case_",
+        "",
+    ],
+)
+def test_case_ref_check_matches_allowlist_regex(case_ref: str):
+    expected = re.fullmatch(r"case_[a-z0-9_]{6,32}", case_ref) is not None
+    assert _is_valid_case_ref(case_ref) is expected
@@ -1,7 +1,7 @@
 import json
 
 from pharmassist_api.contracts.load_schema import examples_dir
-from pharmassist_api.contracts.validate_schema import validate_instance
+from pharmassist_api.contracts.validate_schema import validate_instance, validate_or_return_errors
 
 
 def test_contract_examples_validate_against_schemas():
@@ -14,3 +14,12 @@ def test_contract_examples_validate_against_schemas():
         payload = json.loads(path.read_text(encoding="utf-8"))
         validate_instance(payload, schema_name)
 
+
+def test_cache_clean_only_short_circuits_identical_clean_content():
+    payload = json.loads((examples_dir() / "product.example.json").read_text(encoding="utf-8"))
+    assert validate_or_return_errors(payload, "product", cache_clean=True) == []
+    assert validate_or_return_errors(payload, "product", cache_clean=True) == []
+
+    # Same object mutated into an invalid shape must not hit the clean cache.
+    payload["sku"] = 123
+    assert validate_or_return_errors(payload, "product", cache_clean=True)
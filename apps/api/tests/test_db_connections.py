@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from pharmassist_api import db
+
+
+def test_cached_connection_is_reused_per_db_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "a.db"))
+    db.init_db()
+    first = db._get_conn()
+    assert db._get_conn() is first
+
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "b.db"))
+    db.init_db()
+    assert db._get_conn() is not first
+    assert db.count_patients() == 0
+
+
+def test_row_counters_track_inserts_upserts_and_deletes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "counts.db"))
+    db.init_db()
+    assert db.count_inventory() == 0
+
+    db.upsert_inventory_product(sku="SKU-1", product={"sku": "SKU-1"})
+    db.upsert_inventory_product(sku="SKU-2", product={"sku": "SKU-2"})
+    db.upsert_inventory_product(sku="SKU-1", product={"sku": "SKU-1", "name": "x"})
+    assert db.count_inventory() == 2
+
+    with db._get_conn() as conn:
+        conn.execute("DELETE FROM inventory WHERE sku = 'SKU-2'")
+    assert db.count_inventory() == 1
+
+    # Re-running init_db must not reseed or double count.
+    db.init_db()
+    assert db.count_inventory() == 1
+
+
+def test_read_connection_is_read_only_and_sees_committed_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "ro.db"))
+    db.init_db()
+    reader = db._read_conn()
+    assert reader is not db._get_conn()
+
+    db.upsert_patient(patient_ref="pt_ro", llm_context={"demographics": {}})
+    assert db.get_patient("pt_ro") is not None
+    assert db._read_conn() is reader
+
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("DELETE FROM patients")
+
+
+def test_closed_cached_connections_are_reopened(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "closed.db"))
+    db.init_db()
+    writer = db._get_conn()
+    reader = db._read_conn()
+
+    db.close_cached_connections()
+    assert db._get_conn() is not writer
+    assert db._read_conn() is not reader
+    assert db.count_patients() == 0
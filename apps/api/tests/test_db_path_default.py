@@ -14,4 +14,3 @@ def test_default_db_path_is_repo_local(monkeypatch):
     assert root.name == "pharmassist-kaggle"
     assert (root / "apps" / "api" / "src" / "pharmassist_api").exists()
     assert (root / "packages" / "contracts").exists()
-
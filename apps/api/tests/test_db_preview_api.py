@@ -207,3 +207,42 @@ def test_db_preview_denies_forwarded_headers_without_admin_key(tmp_path, monkeyp
         a["action"] == "deny" and a["reason"] == "forwarded_headers_without_admin_key"
         for a in audits
     )
+
+
+def test_db_preview_every_listed_table_is_previewable(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+    from pharmassist_api.contracts.validate_schema import validate_instance
+
+    db.init_db()
+    for table in db.list_db_preview_tables():
+        payload = db.preview_db_table(table=table, limit=5)
+        validate_instance(payload, "db_preview")
+        assert payload["table"] == table
+
+
+def test_db_preview_projects_json_fields(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    import json
+
+    from pharmassist_api import db
+    from pharmassist_api.contracts.load_schema import examples_dir
+
+    db.init_db()
+    db.upsert_document(doc_ref="doc_ok", metadata={"zeta": 1, "alpha": 2, "mid": 3})
+    docs = db.preview_db_table(table="documents", query="doc_")
+    assert docs["rows"] == [{"doc_ref": "doc_ok", "metadata_keys": ["alpha", "mid", "zeta"]}]
+
+    # Previews trust write-time validation (no per-row guards): a contract-valid
+    # product previews with its fields unchanged.
+    product = json.loads((examples_dir() / "product.example.json").read_text(encoding="utf-8"))
+    db.upsert_inventory_product(sku=product["sku"], product=product)
+    inventory = db.preview_db_table(table="inventory", query=product["sku"])
+    assert inventory["rows"] == [
+        {
+            key: product[key]
+            for key in ("sku", "name", "category", "in_stock", "stock_qty", "price_eur")
+        }
+    ]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.parametrize("answer", ["38", "38,5", "38.5", "+38", "38."])
+def test_number_answers_accept_plain_decimals(answer):
+    from pharmassist_api.follow_up_answers import validate_and_canonicalize_follow_up_answers
+
+    canonical, issues = validate_and_canonicalize_follow_up_answers(
+        [{"question_id": "q_temperature", "answer": answer}]
+    )
+    assert issues == []
+    assert canonical == [{"question_id": "q_temperature", "answer": answer}]
+
+
+@pytest.mark.parametrize("answer", ["abc", "3.8e1", "3_8", "nan", "inf", "38 C"])
+def test_number_answers_reject_non_decimal_spellings(answer):
+    from pharmassist_api.follow_up_answers import validate_and_canonicalize_follow_up_answers
+
+    canonical, issues = validate_and_canonicalize_follow_up_answers(
+        [{"question_id": "q_temperature", "answer": answer}]
+    )
+    assert canonical is None
+    assert [i["code"] for i in issues] == ["INVALID_NUMBER"]
+
+
+@pytest.mark.parametrize(
+    ("question_id", "answer", "message"),
+    [
+        ("q_temperature", "29,9", "Temperature must be between 30 and 45 °C."),
+        ("q_temperature", "45.1", "Temperature must be between 30 and 45 °C."),
+        ("q_duration", "-1", "Duration must be between 0 and 3650 days."),
+        ("q_duration", "3651", "Duration must be between 0 and 3650 days."),
+    ],
+)
+def test_number_answers_reject_out_of_range_values(question_id, answer, message):
+    from pharmassist_api.follow_up_answers import validate_and_canonicalize_follow_up_answers
+
+    canonical, issues = validate_and_canonicalize_follow_up_answers(
+        [{"question_id": question_id, "answer": answer}]
+    )
+    assert canonical is None
+    assert [(i["code"], i["message"]) for i in issues] == [("NUMBER_OUT_OF_RANGE", message)]
+
+
+def test_choice_answers_are_checked_against_bank_choices():
+    from pharmassist_api.follow_up_answers import validate_and_canonicalize_follow_up_answers
+
+    canonical, issues = validate_and_canonicalize_follow_up_answers(
+        [{"question_id": "q_overall_severity", "answer": " moderate "}]
+    )
+    assert issues == []
+    assert canonical == [{"question_id": "q_overall_severity", "answer": "moderate"}]
+
+    canonical, issues = validate_and_canonicalize_follow_up_answers(
+        [{"question_id": "q_overall_severity", "answer": "extreme"}]
+    )
+    assert canonical is None
+    assert issues[0]["code"] == "INVALID_CHOICE"
+    assert issues[0]["message"] == "Answer must be one of: mild, moderate, severe"
+
+
+def test_screen_reports_each_phi_blocker_once_before_validation():
+    from pharmassist_api.follow_up_answers import screen_follow_up_answers
+
+    blockers, canonical, issues = screen_follow_up_answers(
+        [
+            {"question_id": "q_fever", "answer": "not a yes/no"},
+            {"question_id": "q_duration", "answer": "mail test@example.com"},
+        ]
+    )
+    assert canonical is None
+    assert issues == []
+    assert [(v.code, v.json_path) for v in blockers] == [
+        ("PHI_EMAIL", "$.follow_up_answers[1].answer")
+    ]
+
+
+def test_screen_canonicalizes_clean_answers():
+    from pharmassist_api.follow_up_answers import screen_follow_up_answers
+
+    blockers, canonical, issues = screen_follow_up_answers(
+        [{"question_id": "q_fever", "answer": "Oui"}, {"question_id": "q_duration", "answer": "3"}]
+    )
+    assert blockers == []
+    assert issues == []
+    assert canonical == [
+        {"question_id": "q_fever", "answer": "yes"},
+        {"question_id": "q_duration", "answer": "3"},
+    ]
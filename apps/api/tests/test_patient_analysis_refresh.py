@@ -199,3 +199,118 @@ def test_analysis_status_last_error_is_sanitized(tmp_path, monkeypatch):
         failed = _wait_for_status(client, patient_ref, "failed")
         assert failed["status"] == "failed"
         assert failed.get("last_error") == "not_found"
+
+
+def test_inbox_batched_status_matches_single_patient_status(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import analysis_refresh, db
+    from pharmassist_api.main import reset_admin_guard_state_for_tests
+    from pharmassist_api.pharmacy import ensure_pharmacy_dataset_loaded
+
+    reset_admin_guard_state_for_tests()
+    db.init_db()
+    ensure_pharmacy_dataset_loaded()
+
+    inbox = analysis_refresh.get_patients_inbox(limit=200)
+    assert inbox["patients"]
+    for item in inbox["patients"]:
+        single = analysis_refresh.get_patient_analysis_status(patient_ref=item["patient_ref"])
+        item_cmp = {k: v for k, v in item.items() if k != "updated_at"}
+        single_cmp = {k: v for k, v in single.items() if k != "updated_at"}
+        assert item_cmp == single_cmp
+
+    async_inbox = asyncio.run(analysis_refresh.aget_patients_inbox(limit=200))
+    assert [{k: v for k, v in item.items() if k != "updated_at"} for item in async_inbox["patients"]] == [
+        {k: v for k, v in item.items() if k != "updated_at"} for item in inbox["patients"]
+    ]
+
+
+def test_queue_refresh_coalesces_pending_callers_and_can_be_awaited(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import analysis_refresh, db
+    from pharmassist_api.main import reset_admin_guard_state_for_tests
+    from pharmassist_api.pharmacy import ensure_pharmacy_dataset_loaded
+
+    reset_admin_guard_state_for_tests()
+    db.init_db()
+    ensure_pharmacy_dataset_loaded()
+
+    state_writes: list[str] = []
+    orig_set_state = db.set_patient_analysis_state
+
+    def _counting_set_state(**kwargs):
+        state_writes.append(kwargs["status"])
+        return orig_set_state(**kwargs)
+
+    monkeypatch.setattr(db, "set_patient_analysis_state", _counting_set_state)
+
+    async def _scenario() -> tuple[list[dict], bool]:
+        # Racing callers: every call is in flight before any DB write completes.
+        results = await asyncio.gather(
+            *(
+                analysis_refresh.queue_patient_refresh(patient_ref="pt_000000", reason=reason)
+                for reason in ("a", "b", "c", "d", "e")
+            )
+        )
+        done = await analysis_refresh.wait_for_patient_refresh(
+            patient_ref="pt_000000", timeout_sec=20.0
+        )
+        return results, done
+
+    results, done = asyncio.run(_scenario())
+    assert [r["queued"] for r in results] == [True, False, False, False, False]
+    assert done is True
+    assert state_writes.count("refresh_pending") == 1
+    assert state_writes.count("running") == 1
+
+    status = analysis_refresh.get_patient_analysis_status(patient_ref="pt_000000")
+    assert status["status"] == "up_to_date"
+
+
+def test_patient_refs_with_visits_follow_latest_visit_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+
+    db.init_db()
+    for ref in ("pt_a", "pt_b", "pt_c"):
+        db.upsert_patient(patient_ref=ref, llm_context={})
+
+    def add_visit(visit_ref: str, patient_ref: str, occurred_at: str) -> None:
+        db.upsert_visit(
+            visit_ref=visit_ref,
+            patient_ref=patient_ref,
+            occurred_at=occurred_at,
+            primary_domain=None,
+            intents=[],
+            intake_extracted={},
+        )
+
+    def expected() -> list[str]:
+        with db._get_conn() as conn:
+            rows = conn.execute(
+                """
+                SELECT patient_ref FROM visits
+                GROUP BY patient_ref
+                ORDER BY MAX(occurred_at) DESC, patient_ref ASC
+                """
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    add_visit("v1", "pt_a", "2025-01-03")
+    add_visit("v2", "pt_b", "2025-01-02")
+    add_visit("v3", "pt_c", "2025-01-02")
+    add_visit("v4", "pt_b", "2025-01-01")
+    assert db.list_patient_refs_with_visits(limit=None) == expected() == ["pt_a", "pt_b", "pt_c"]
+
+    # Moving a visit back in time, or to another patient, recomputes both sides.
+    add_visit("v1", "pt_a", "2024-12-31")
+    add_visit("v4", "pt_c", "2025-01-05")
+    assert db.list_patient_refs_with_visits(limit=None) == expected()
+    assert db.list_patient_refs_with_visits(limit=2) == expected()[:2]
+
+    with db._get_conn() as conn:
+        conn.execute("DELETE FROM visits WHERE patient_ref = 'pt_a'")
+    assert db.list_patient_refs_with_visits(limit=None) == expected() == ["pt_c", "pt_b"]
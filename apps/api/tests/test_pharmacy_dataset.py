@@ -129,6 +129,15 @@ def test_pharmacy_dataset_loader_sanitizes_event_payloads(tmp_path, monkeypatch)
         payload = json.loads(row[1])
         assert payload == {"items": [{"sku": "SKU-0001", "qty": 1}]}
 
+        # Secondary indexes dropped for the bulk load are rebuilt afterwards.
+        index_names = {
+            r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert {
+            "idx_visits_patient_ref_occurred_at",
+            "idx_events_patient_ref_occurred_at",
+        } <= index_names
+
 
 def test_patients_endpoints_and_run_from_visit(tmp_path, monkeypatch):
     monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
@@ -299,3 +308,39 @@ def test_pharmacy_dataset_loader_accepts_document_uploaded_metadata_only(tmp_pat
             "redaction_applied": True,
             "redaction_replacements": 4,
         }
+
+
+def test_search_patients_returns_only_object_demographics(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+
+    db.init_db()
+    db.upsert_patient(
+        patient_ref="pt_000001",
+        llm_context={"demographics": {"age_years": 34, "sex": "F"}, "allergies": []},
+    )
+    db.upsert_patient(patient_ref="pt_000002", llm_context={"demographics": "n/a"})
+    db.upsert_patient(patient_ref="pt_000003", llm_context={"allergies": []})
+
+    hits = db.search_patients(query_prefix="pt_00000")
+    assert hits == [
+        {"patient_ref": "pt_000001", "demographics": {"age_years": 34, "sex": "F"}},
+        {"patient_ref": "pt_000002", "demographics": {}},
+        {"patient_ref": "pt_000003", "demographics": {}},
+    ]
+
+
+def test_search_patients_prefix_query_avoids_sorting_matches(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+
+    db.init_db()
+    with db._get_conn() as conn:
+        plan = " ".join(
+            str(row[3])
+            for row in conn.execute("EXPLAIN QUERY PLAN " + db._SQL_SEARCH_PATIENTS, ("pt_%", 20))
+        )
+    assert "idx_patients_patient_ref_nocase" in plan
+    assert "TEMP B-TREE FOR ORDER BY" not in plan
@@ -29,3 +29,13 @@ def test_phi_scanner_warns_on_standalone_postal_code():
 def test_phi_scanner_does_not_flag_paris_15e_text():
     violations = scan_for_phi({"note": "Paris 15e"})
     assert not violations
+
+
+def test_violation_to_dict_is_the_json_form():
+    violation = scan_for_phi({"note": "contact me at test@example.com"})[0]
+    assert violation.to_dict() == {
+        "code": violation.code,
+        "severity": violation.severity,
+        "json_path": violation.json_path,
+        "message": violation.message,
+    }
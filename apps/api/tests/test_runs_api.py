@@ -52,3 +52,88 @@ def test_create_run_rejects_invalid_follow_up_answers(tmp_path, monkeypatch):
         assert resp.status_code == 400
         payload = resp.json()
         assert payload.get("detail", {}).get("error") == "Invalid follow_up_answers"
+
+
+def test_insert_events_batch_returns_ids_in_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+    from pharmassist_api.orchestrator import new_run
+
+    db.init_db()
+    run = new_run(case_ref="case_000042", language="fr", trigger="manual")
+    run_id = run["run_id"]
+
+    first_id = db.insert_event(run_id, "step_started", {"step": "pipeline"})
+    batch_ids = db.insert_events(
+        run_id,
+        [("step_completed", {"step": "A1"}), ("finalized", {"message": "done"})],
+    )
+    assert batch_ids == [first_id + 1, first_id + 2]
+
+    events = db.list_events(run_id, after_id=first_id)
+    assert [e["id"] for e in events] == batch_ids
+    assert [e["data"]["type"] for e in events] == ["step_completed", "finalized"]
+
+    # Paged iteration returns the same sequence across page boundaries.
+    monkeypatch.setattr(db, "_EVENTS_PAGE_SIZE", 2)
+    assert [e["id"] for e in db.iter_events(run_id)] == [
+        e["id"] for e in db.list_events(run_id, after_id=0)
+    ]
+    assert [e["id"] for e in db.iter_events(run_id)][-3:] == [first_id, *batch_ids]
+
+    page = db.list_event_rows(run_id, after_id=first_id, limit=1)
+    assert [(eid, event_type) for eid, event_type, _ in page] == [(batch_ids[0], "step_completed")]
+
+
+def test_list_events_query_uses_run_events_index_without_sort(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+
+    db.init_db()
+    with db._get_conn() as conn:
+        plan = " ".join(
+            str(row[3])
+            for row in conn.execute("EXPLAIN QUERY PLAN " + db._SQL_LIST_RUN_EVENTS, ("r", 0, 10))
+        )
+    assert "idx_run_events_run_id_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_run_exists_and_status_lookup(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    from pharmassist_api import db
+    from pharmassist_api.orchestrator import new_run
+
+    db.init_db()
+    run = new_run(case_ref="case_000042", language="fr", trigger="manual")
+
+    assert db.run_exists(run["run_id"])
+    assert db.get_run_status(run["run_id"]) == "created"
+    assert not db.run_exists("run_missing")
+    assert db.get_run_status("run_missing") is None
+
+
+def test_get_run_json_matches_get_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHARMASSIST_DB_PATH", str(tmp_path / "test.db"))
+
+    import json
+
+    from pharmassist_api import db
+    from pharmassist_api.orchestrator import new_run
+
+    db.init_db()
+    run = new_run(case_ref="case_000042", language="fr", trigger="manual")
+    db.update_run(
+        run["run_id"],
+        status="completed",
+        artifacts={"report_markdown": "# Rapport\n\n- fièvre 38,5 °C", "score": 0.25},
+        policy_violations=[],
+    )
+
+    raw = db.get_run_json(run["run_id"])
+    assert raw is not None
+    assert json.loads(raw) == db.get_run(run["run_id"])
+    assert db.get_run_json("run_missing") is None
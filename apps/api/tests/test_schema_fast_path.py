@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from pharmassist_api.contracts.load_schema import examples_dir
+from pharmassist_api.contracts.validate_schema import (
+    _fast_validator_for,
+    _validator_for,
+    validate_or_return_errors,
+)
+
+pytest.importorskip("fastjsonschema")
+
+
+def _fast_accepts(schema_name: str, instance) -> bool:
+    fast = _fast_validator_for(schema_name)
+    assert fast is not None
+    try:
+        fast(instance)
+    except Exception:
+        return False
+    return True
+
+
+def test_fast_path_never_accepts_what_jsonschema_rejects():
+    for path in sorted(examples_dir().glob("*.example.json")):
+        schema_name = path.name.replace(".example.json", "")
+        if _fast_validator_for(schema_name) is None:
+            continue
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        mutations = [payload, {}, [], "x", None]
+        if isinstance(payload, dict):
+            for key in payload:
+                mutations.append({k: v for k, v in payload.items() if k != key})
+                mutations.append({**payload, key: {"unexpected": True}})
+            mutations.append({**payload, "unexpected_field": 1})
+        for instance in mutations:
+            if _fast_accepts(schema_name, instance):
+                assert not list(_validator_for(schema_name).iter_errors(instance)), (
+                    schema_name,
+                    instance,
+                )
+
+
+def test_fast_path_failure_still_reports_jsonschema_issues():
+    issues = validate_or_return_errors({"schema_version": "0.0.0"}, "evidence_item")
+    assert issues
+    assert all(i.json_path.startswith("$") for i in issues)